@@ -3,5 +3,7 @@ from __future__ import annotations
 from .cli import main
 
 
-raise SystemExit(main())
-
+# Guarded: the sync parse pool may start worker processes with "spawn" (Windows/macOS),
+# which re-imports the main module in every worker.
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -151,6 +151,7 @@ def main(argv: list[str] | None = None) -> int:
         print(
             "Sync ferdig:",
             f"pages={res.pages}",
+            f"uendret={res.pages_skipped}",
             f"rows={res.rows_seen}",
             f"wa_ok={res.wa_points_ok}",
             f"wa_failed={res.wa_points_failed}",
@@ -174,6 +175,7 @@ def main(argv: list[str] | None = None) -> int:
         print(
             "Sync ferdig (Kondis):",
             f"pages={res.pages}",
+            f"uendret={res.pages_skipped}",
             f"rows={res.rows_seen}",
             f"wa_ok={res.wa_points_ok}",
             f"wa_failed={res.wa_points_failed}",
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sequence
 
 SCHEMA_VERSION = 2
 
@@ -93,6 +95,7 @@ CREATE TABLE IF NOT EXISTS results (
 CREATE INDEX IF NOT EXISTS idx_results_athlete ON results(athlete_id, season);
 CREATE INDEX IF NOT EXISTS idx_results_event ON results(event_id, season, gender);
 CREATE INDEX IF NOT EXISTS idx_results_points ON results(season, gender, event_id, wa_points);
+CREATE INDEX IF NOT EXISTS idx_results_source ON results(source_url, gender, season);
 
 CREATE TABLE IF NOT EXISTS sources (
     id INTEGER PRIMARY KEY,
@@ -120,6 +123,28 @@ CREATE TABLE IF NOT EXISTS change_log (
 );
 CREATE INDEX IF NOT EXISTS idx_changelog_record ON change_log(table_name, record_id);
 
+-- Memo of wa_poeng scores. scoring_key identifies the WA scoring DB the points were computed from.
+CREATE TABLE IF NOT EXISTS wa_points_cache (
+    scoring_key TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    wa_event TEXT NOT NULL,
+    performance TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    exact INTEGER NOT NULL CHECK(exact IN (0, 1)),
+    PRIMARY KEY (scoring_key, gender, wa_event, performance)
+) WITHOUT ROWID;
+
+-- What each fetched page (per gender/season) was last ingested from; lets unchanged pages skip re-ingest.
+CREATE TABLE IF NOT EXISTS page_manifest (
+    source_url TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    signature TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_url, gender, season)
+);
+
 CREATE TABLE IF NOT EXISTS athlete_aliases (
     id INTEGER PRIMARY KEY,
     canonical_id INTEGER NOT NULL REFERENCES athletes(id),
@@ -178,6 +203,44 @@ def connect(db_path: Path) -> sqlite3.Connection:
     return con
 
 
+_BULK_INGEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-65536;",
+    "PRAGMA mmap_size=268435456;",
+)
+
+
+@contextmanager
+def bulk_ingest(con: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Tune a connection for a sync: WAL with relaxed fsync, a 64 MiB page cache and IMMEDIATE write transactions.
+
+    On exit the database goes back to a rollback journal with full sync, so the .sqlite3 file is
+    self-contained again (CI caches and exports the bare file, without -wal/-shm siblings).
+    """
+    isolation_level = con.isolation_level
+    for pragma in _BULK_INGEST_PRAGMAS:
+        con.execute(pragma)
+    # Take the write lock when each page's transaction starts instead of upgrading mid-way.
+    con.isolation_level = "IMMEDIATE"
+    failed = True
+    try:
+        yield con
+        failed = False
+    finally:
+        try:
+            if con.in_transaction:
+                con.rollback()
+            con.isolation_level = isolation_level
+            con.execute("PRAGMA journal_mode=DELETE;")
+            con.execute("PRAGMA synchronous=FULL;")
+        except sqlite3.Error:
+            # After a failed ingest (e.g. database locked) the restore can fail too; keep the original error.
+            if not failed:
+                raise
+
+
 def _table_columns(con: sqlite3.Connection, table: str) -> set[str]:
     return {row[1] for row in con.execute(f"PRAGMA table_info({table})").fetchall()}
 
@@ -223,6 +286,26 @@ def init_db(con: sqlite3.Connection) -> None:
     con.commit()
 
 
+_UPSERT_ATHLETE_SQL = """
+    INSERT INTO athletes (id, gender, name, birth_date, nationality)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        gender=excluded.gender,
+        name=CASE
+            WHEN TRIM(athletes.name) = '' THEN excluded.name
+            WHEN TRIM(excluded.name) = '' THEN athletes.name
+            WHEN LENGTH(TRIM(excluded.name)) > LENGTH(TRIM(athletes.name)) THEN excluded.name
+            ELSE athletes.name
+        END,
+        birth_date=COALESCE(excluded.birth_date, athletes.birth_date),
+        nationality=CASE
+            WHEN athletes.nationality != 'NOR' THEN athletes.nationality
+            ELSE excluded.nationality
+        END,
+        updated_at=CURRENT_TIMESTAMP
+"""
+
+
 def upsert_athlete(
     *,
     con: sqlite3.Connection,
@@ -233,26 +316,25 @@ def upsert_athlete(
     nationality: str = "NOR",
 ) -> None:
     norm_name = " ".join((name or "").split())
-    con.execute(
-        """
-        INSERT INTO athletes (id, gender, name, birth_date, nationality)
-        VALUES (?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET
-            gender=excluded.gender,
-            name=CASE
-                WHEN TRIM(athletes.name) = '' THEN excluded.name
-                WHEN TRIM(excluded.name) = '' THEN athletes.name
-                WHEN LENGTH(TRIM(excluded.name)) > LENGTH(TRIM(athletes.name)) THEN excluded.name
-                ELSE athletes.name
-            END,
-            birth_date=COALESCE(excluded.birth_date, athletes.birth_date),
-            nationality=CASE
-                WHEN athletes.nationality != 'NOR' THEN athletes.nationality
-                ELSE excluded.nationality
-            END,
-            updated_at=CURRENT_TIMESTAMP
-        """,
-        (athlete_id, gender, norm_name, birth_date, nationality),
+    con.execute(_UPSERT_ATHLETE_SQL, (athlete_id, gender, norm_name, birth_date, nationality))
+
+
+def upsert_athletes(
+    *,
+    con: sqlite3.Connection,
+    rows: Iterable[tuple[int, str, str, str | None, str]],
+) -> None:
+    """Batch form of upsert_athlete.
+
+    Rows are (athlete_id, gender, name, birth_date, nationality) and are applied in order, so repeated ids
+    merge exactly as they would with one upsert_athlete call per row.
+    """
+    con.executemany(
+        _UPSERT_ATHLETE_SQL,
+        (
+            (athlete_id, gender, " ".join((name or "").split()), birth_date, nationality)
+            for athlete_id, gender, name, birth_date, nationality in rows
+        ),
     )
 
 
@@ -325,6 +407,51 @@ def upsert_competition(
     return int(competition_id)
 
 
+_RESULT_COLUMNS = (
+    "season", "gender", "event_id", "athlete_id", "club_id", "rank_in_list",
+    "performance_raw", "performance_clean", "value", "wind", "placement_raw",
+    "competition_id", "competition_name", "venue_city", "stadium", "result_date",
+    "wa_points", "wa_exact", "wa_event", "wa_error", "source_url", "source_type",
+)
+_RESULT_INSERT_SQL = f"""
+    INSERT INTO results ({", ".join(_RESULT_COLUMNS)}) VALUES """
+_RESULT_COLUMN_COUNT = len(_RESULT_COLUMNS)
+_RESULT_PLACEHOLDERS = "(" + ", ".join("?" * _RESULT_COLUMN_COUNT) + ")"
+_RESULT_ON_CONFLICT_SQL = """
+    ON CONFLICT DO UPDATE SET
+        club_id=excluded.club_id,
+        rank_in_list=excluded.rank_in_list,
+        performance_clean=excluded.performance_clean,
+        value=excluded.value,
+        wind=excluded.wind,
+        competition_name=COALESCE(excluded.competition_name, results.competition_name),
+        venue_city=COALESCE(excluded.venue_city, results.venue_city),
+        stadium=COALESCE(excluded.stadium, results.stadium),
+        wa_points=excluded.wa_points,
+        wa_exact=excluded.wa_exact,
+        wa_event=excluded.wa_event,
+        wa_error=excluded.wa_error,
+        source_type=COALESCE(excluded.source_type, results.source_type),
+        scraped_at=CURRENT_TIMESTAMP
+"""
+# For a row a page rebuild already owns: take every column from the new row, as the old
+# delete-and-reinsert did, so a field the parser no longer fills is cleared.
+_RESULT_OVERWRITE_ON_CONFLICT_SQL = (
+    "\n    ON CONFLICT DO UPDATE SET\n"
+    + "".join(f"        {c}=excluded.{c},\n" for c in _RESULT_COLUMNS)
+    + "        scraped_at=CURRENT_TIMESTAMP\n"
+)
+_UPSERT_RESULT_SQL = _RESULT_INSERT_SQL + _RESULT_PLACEHOLDERS + _RESULT_ON_CONFLICT_SQL
+
+# Rows per multi-row upsert statement, kept under SQLITE_MAX_VARIABLE_NUMBER (999 before SQLite 3.32).
+_RESULT_BATCH_ROWS = min(500, (32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999) // _RESULT_COLUMN_COUNT)
+
+
+@lru_cache(maxsize=16)
+def _upsert_results_sql(n_rows: int, on_conflict: str = _RESULT_ON_CONFLICT_SQL) -> str:
+    return _RESULT_INSERT_SQL + ", ".join([_RESULT_PLACEHOLDERS] * n_rows) + on_conflict
+
+
 def upsert_result(
     *,
     con: sqlite3.Connection,
@@ -352,29 +479,7 @@ def upsert_result(
     source_type: str | None = None,
 ) -> None:
     con.execute(
-        """
-        INSERT INTO results (
-            season, gender, event_id, athlete_id, club_id, rank_in_list,
-            performance_raw, performance_clean, value, wind, placement_raw,
-            competition_id, competition_name, venue_city, stadium, result_date,
-            wa_points, wa_exact, wa_event, wa_error, source_url, source_type
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT DO UPDATE SET
-            club_id=excluded.club_id,
-            rank_in_list=excluded.rank_in_list,
-            performance_clean=excluded.performance_clean,
-            value=excluded.value,
-            wind=excluded.wind,
-            competition_name=COALESCE(excluded.competition_name, results.competition_name),
-            venue_city=COALESCE(excluded.venue_city, results.venue_city),
-            stadium=COALESCE(excluded.stadium, results.stadium),
-            wa_points=excluded.wa_points,
-            wa_exact=excluded.wa_exact,
-            wa_event=excluded.wa_event,
-            wa_error=excluded.wa_error,
-            source_type=COALESCE(excluded.source_type, results.source_type),
-            scraped_at=CURRENT_TIMESTAMP
-        """,
+        _UPSERT_RESULT_SQL,
         (
             season,
             gender,
@@ -402,6 +507,148 @@ def upsert_result(
     )
 
 
+def upsert_results(*, con: sqlite3.Connection, rows: Iterable[tuple]) -> None:
+    """Batch form of upsert_result.
+
+    Each row holds the values of the results INSERT column list, in that order (season, gender, event_id,
+    athlete_id, ..., source_url, source_type). Athletes, clubs, events and competitions referenced by the rows
+    must already exist.
+
+    Rows are sent as multi-row VALUES statements of up to _RESULT_BATCH_ROWS rows. SQLite applies the upsert
+    to each VALUES row in turn, so the outcome matches one upsert_result call per row.
+    """
+    _upsert_result_batches(con=con, rows=rows, on_conflict=_RESULT_ON_CONFLICT_SQL)
+
+
+def _upsert_result_batches(*, con: sqlite3.Connection, rows: Iterable[tuple], on_conflict: str) -> None:
+    batch: list = []
+    for row in rows:
+        batch.extend(row)
+        if len(batch) == _RESULT_BATCH_ROWS * _RESULT_COLUMN_COUNT:
+            con.execute(_upsert_results_sql(_RESULT_BATCH_ROWS, on_conflict), batch)
+            batch = []
+    if batch:
+        con.execute(_upsert_results_sql(len(batch) // _RESULT_COLUMN_COUNT, on_conflict), batch)
+
+
+_NATURAL_KEY_COLUMNS_SQL = """
+    season, gender, event_id, athlete_id, IFNULL(result_date, ''), performance_raw,
+    IFNULL(competition_id, -1), IFNULL(placement_raw, '')
+"""
+
+
+def _natural_key(row: tuple) -> tuple:
+    """uix_results_natural key of an upsert_results row tuple."""
+    return (
+        row[0],
+        row[1],
+        row[2],
+        row[3],
+        "" if row[15] is None else row[15],
+        row[6],
+        -1 if row[11] is None else row[11],
+        "" if row[10] is None else row[10],
+    )
+
+
+def replace_results(*, con: sqlite3.Connection, rows: Sequence[tuple], where: str, params: Sequence[object]) -> int:
+    """Make the results selected by `where` exactly `rows` (upsert_results row tuples). Returns rows deleted.
+
+    Rows that resurface keep their id and are overwritten in place, every column included, so re-ingesting
+    a mostly unchanged page costs an indexed read of its keys rather than deleting and re-inserting every
+    row. Afterwards only the rows matching `where` whose natural key is no longer in `rows` are deleted.
+    Rows that collide with another source's result are merged as in upsert_results.
+    """
+    keys_before = {
+        tuple(key): result_id
+        for result_id, *key in con.execute(
+            f"SELECT id, {_NATURAL_KEY_COLUMNS_SQL} FROM results WHERE {where}", tuple(params)
+        )
+    }
+    if not keys_before:
+        upsert_results(con=con, rows=rows)
+        return 0
+    # The first row per owned key stands in for the re-inserted row; later rows with the same key
+    # merge into it, just as they did after the old delete.
+    overwrite: list[tuple] = []
+    merge: list[tuple] = []
+    keys_after: set[tuple] = set()
+    for row in rows:
+        key = _natural_key(row)
+        if key in keys_before and key not in keys_after:
+            overwrite.append(row)
+        else:
+            merge.append(row)
+        keys_after.add(key)
+    _upsert_result_batches(con=con, rows=overwrite, on_conflict=_RESULT_OVERWRITE_ON_CONFLICT_SQL)
+    _upsert_result_batches(con=con, rows=merge, on_conflict=_RESULT_ON_CONFLICT_SQL)
+    stale = [(result_id,) for key, result_id in keys_before.items() if key not in keys_after]
+    if stale:
+        con.executemany("DELETE FROM results WHERE id = ?", stale)
+    return len(stale)
+
+
+def load_wa_points_cache(
+    *, con: sqlite3.Connection, scoring_key: str
+) -> dict[tuple[str, str, str], tuple[int, int]]:
+    """Cached (points, exact) per (gender, wa_event, performance); entries from other scoring DBs are dropped."""
+    con.execute("DELETE FROM wa_points_cache WHERE scoring_key != ?", (scoring_key,))
+    rows = con.execute(
+        "SELECT gender, wa_event, performance, points, exact FROM wa_points_cache WHERE scoring_key = ?",
+        (scoring_key,),
+    )
+    return {(r[0], r[1], r[2]): (int(r[3]), int(r[4])) for r in rows}
+
+
+def store_wa_points(
+    *,
+    con: sqlite3.Connection,
+    scoring_key: str,
+    gender: str,
+    wa_event: str,
+    performance: str,
+    points: int,
+    exact: int,
+) -> None:
+    con.execute(
+        """
+        INSERT OR IGNORE INTO wa_points_cache (scoring_key, gender, wa_event, performance, points, exact)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (scoring_key, gender, wa_event, performance, points, exact),
+    )
+
+
+def page_signature(*, con: sqlite3.Connection, source_url: str, gender: str, season: int) -> Optional[str]:
+    row = con.execute(
+        "SELECT signature FROM page_manifest WHERE source_url = ? AND gender = ? AND season = ?",
+        (source_url, gender, season),
+    ).fetchone()
+    return row["signature"] if row else None
+
+
+def set_page_signature(
+    *,
+    con: sqlite3.Connection,
+    source_url: str,
+    gender: str,
+    season: int,
+    signature: str,
+    row_count: int,
+) -> None:
+    con.execute(
+        """
+        INSERT INTO page_manifest (source_url, gender, season, signature, row_count)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(source_url, gender, season) DO UPDATE SET
+            signature=excluded.signature,
+            row_count=excluded.row_count,
+            ingested_at=CURRENT_TIMESTAMP
+        """,
+        (source_url, gender, season, signature, row_count),
+    )
+
+
 def upsert_source(
     *,
     con: sqlite3.Connection,
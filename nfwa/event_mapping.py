@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from typing import AbstractSet, Optional
 
 
 _DIST_METER_RE = re.compile(r"^(?P<m>\d+)\s+meter$")
@@ -60,7 +60,7 @@ def infer_orientation(event_no: str) -> str:
     return "higher"
 
 
-def map_event_to_wa(*, event_no: str, gender: str, wa_events: set[str]) -> Optional[str]:
+def map_event_to_wa(*, event_no: str, gender: str, wa_events: AbstractSet[str]) -> Optional[str]:
     name = (event_no or "").strip()
     if not name:
         return None
@@ -1,21 +1,34 @@
 ﻿from __future__ import annotations
 
 from collections import defaultdict
+import gzip
 import hashlib
+import os
+import pickle
 import re
 import shutil
+import sqlite3
 import subprocess
+import sys
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Optional
 
 import requests
-from lxml import html
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .minfriidrett import ScrapedResult
-from .util import clean_performance, parse_ddmmyy
+from .util import clean_performance, parse_ddmmyy, prepare_versioned_cache_dir, versioned_cache_dir
 
 
 @dataclass(frozen=True)
@@ -285,12 +298,94 @@ FRIIDRETT_PAGES: tuple[FriidrettPage, ...] = (
 )
 
 
+def _index_pages(pages: Iterable[FriidrettPage]) -> dict[tuple[int, str], tuple[FriidrettPage, ...]]:
+    index: dict[tuple[int, str], list[FriidrettPage]] = {}
+    for p in dict.fromkeys(pages):
+        index.setdefault((p.season, "Both"), []).append(p)
+        index.setdefault((p.season, p.gender), []).append(p)
+    return {key: tuple(ps) for key, ps in index.items()}
+
+
+# (season, gender | "Both") -> pages in FRIIDRETT_PAGES order, built once at import.
+_PAGES_BY_YEAR_GENDER = _index_pages(FRIIDRETT_PAGES)
+
+
 def pages_for_years(*, years: Iterable[int], gender: str = "Both") -> list[FriidrettPage]:
-    ys = {int(y) for y in years}
-    pages = [p for p in FRIIDRETT_PAGES if int(p.season) in ys]
-    if gender == "Both":
-        return pages
-    return [p for p in pages if p.gender == gender]
+    out: list[FriidrettPage] = []
+    for y in sorted({int(y) for y in years}):
+        out.extend(_PAGES_BY_YEAR_GENDER.get((y, gender), ()))
+    return out
+
+
+def unique_urls(pages: Iterable[FriidrettPage]) -> list[str]:
+    """Page URLs in first-seen order, without repeats.
+
+    Kappgang documents are listed once per gender, but only need fetching once.
+    """
+    return list(dict.fromkeys(p.url for p in pages))
+
+
+_HTTP_HEADERS = {
+    "User-Agent": "nfwa-local/0.1 (contact: local)",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
+def _make_session() -> requests.Session:
+    sess = requests.Session()
+    sess.headers.update(_HTTP_HEADERS)
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    return sess
+
+
+# Shared across calls so friidrett.no pages reuse one keep-alive connection pool.
+_SESSION = _make_session()
+
+
+_PAGE_STORE_NAME = "pages.sqlite"
+
+
+class _PageStore:
+    """URL -> gzip-compressed page body, kept in one SQLite file per cache directory."""
+
+    def __init__(self, path: Path) -> None:
+        # fetch_pages() reads and writes from worker threads; one connection behind a lock.
+        self._con = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._con:
+            self._con.execute("PRAGMA journal_mode=WAL;")
+            self._con.execute("PRAGMA synchronous=NORMAL;")
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, content BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+            )
+
+    def get(self, url: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._con.execute("SELECT content FROM pages WHERE url = ?", (url,)).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def put(self, url: str, packed: bytes) -> None:
+        with self._lock, self._con:
+            self._con.execute(
+                "INSERT OR REPLACE INTO pages (url, content, fetched_at) VALUES (?, ?, ?)",
+                (url, packed, int(time.time())),
+            )
+
+
+_PAGE_STORES: dict[Path, _PageStore] = {}
+_PAGE_STORES_LOCK = threading.Lock()
+
+
+def _page_store(cache_dir: Path) -> _PageStore:
+    with _PAGE_STORES_LOCK:
+        store = _PAGE_STORES.get(cache_dir)
+        if store is None:
+            _ensure_dir(cache_dir)
+            store = _PAGE_STORES[cache_dir] = _PageStore(cache_dir / _PAGE_STORE_NAME)
+        return store
 
 
 def fetch_page(
@@ -300,34 +395,231 @@ def fetch_page(
     refresh: bool = False,
     session: Optional[requests.Session] = None,
 ) -> bytes:
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_path = cache_dir / _safe_cache_filename(url)
-    if cache_path.exists() and not refresh:
-        return cache_path.read_bytes()
-
-    sess = session or requests.Session()
-    headers = {"User-Agent": "nfwa-local/0.1 (contact: local)"}
-    resp = sess.get(url, headers=headers, timeout=60)
+    # Pages are cached gzip-compressed (Word-HTML shrinks ~8x) in a single SQLite store
+    # instead of one file per URL. Per-URL files (.html.gz or plain) from older runs are
+    # still read and moved into the store the first time they are hit.
+    store = _page_store(cache_dir)
+    if not refresh:
+        packed = store.get(url)
+        if packed is not None:
+            try:
+                return gzip.decompress(packed)
+            except (OSError, EOFError, zlib.error):
+                pass  # damaged cache entry: fetch again
+        else:
+            cached = _read_legacy_cache_files(cache_dir, url)
+            if cached is not None:
+                store.put(url, gzip.compress(cached, compresslevel=6, mtime=0))
+                _remove_legacy_cache_files(cache_dir, url)
+                return cached
+
+    sess = session or _SESSION
+    resp = sess.get(url, headers=_HTTP_HEADERS, timeout=60)
     resp.raise_for_status()
     content = resp.content
-    cache_path.write_bytes(content)
+    store.put(url, gzip.compress(content, compresslevel=6, mtime=0))
+    _remove_legacy_cache_files(cache_dir, url)
     return content
 
 
-def parse_page(*, html_bytes: bytes, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
-    """Parse friidrett.no Word-HTML pages (legacy) and return best-per-athlete rows per event."""
-    if html_bytes.lstrip().startswith(b"%PDF"):
+def _read_legacy_cache_files(cache_dir: Path, url: str) -> Optional[bytes]:
+    cache_path = cache_dir / _safe_cache_filename(url)
+    packed = _read_cache_file(cache_path.with_name(cache_path.name + ".gz"))
+    if packed is not None:
+        try:
+            return gzip.decompress(packed)
+        except (OSError, EOFError, zlib.error):
+            return None
+    return _read_cache_file(cache_path)
+
+
+def _remove_legacy_cache_files(cache_dir: Path, url: str) -> None:
+    cache_path = cache_dir / _safe_cache_filename(url)
+    cache_path.with_name(cache_path.name + ".gz").unlink(missing_ok=True)
+    cache_path.unlink(missing_ok=True)
+
+
+def fetch_pages(
+    *,
+    pages: Iterable[FriidrettPage],
+    cache_dir: Path,
+    refresh: bool = False,
+    session: Optional[requests.Session] = None,
+    max_workers: int = 8,
+) -> dict[str, bytes | Exception]:
+    """Fetch many legacy pages concurrently, keyed by URL.
+
+    A failed fetch is stored as its exception so the caller can report it per page.
+    """
+    urls = unique_urls(pages)
+    if not urls:
+        return {}
+    _ensure_dir(cache_dir)
+    sess = session or _SESSION
+
+    out: dict[str, bytes | Exception] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as pool:
+        futures = {
+            pool.submit(fetch_page, url=url, cache_dir=cache_dir, refresh=refresh, session=sess): url
+            for url in urls
+        }
+        for fut in as_completed(futures):
+            try:
+                out[futures[fut]] = fut.result()
+            except Exception as exc:  # noqa: BLE001 - surfaced by the caller per page
+                out[futures[fut]] = exc
+    return out
+
+
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    # One mkdir syscall per directory per process instead of one per fetch.
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _read_cache_file(path: Path) -> Optional[bytes]:
+    # Raw fd read sized by fstat: no exists() probe and no Python file object.
+    # O_BINARY keeps Windows from translating CRLF / stopping at 0x1A.
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        return None
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+# lxml parser objects are not safe to share between threads, so each thread keeps one.
+# The id map (collect_ids) is never used by the parsers below.
+_PARSER_LOCAL = threading.local()
+
+
+def _html_parser() -> html.HTMLParser:
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = html.HTMLParser(collect_ids=False, remove_comments=True, remove_pis=True)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+# Compiled once; element.xpath() would recompile the expression on every call. Plain
+# descendant/child lookups use lxml's iter()/iterchildren() tree walks instead.
+_BODY_NODES_XP = etree.XPath("/html/body//*")
+
+# Parsed rows per (sha256 of body, season, gender, source URL) for the last few bodies parsed
+# without an on-disk cache, so a body that is handed to parse_page again skips the lxml/regex
+# pass. Kept small (least recently used first) so a long sync doesn't hold every page's rows.
+_PARSED_CACHE: dict[tuple[bytes, int, str, str], list[ScrapedResult]] = {}
+_PARSED_CACHE_SIZE = 8
+
+
+def _parser_version() -> bytes:
+    # On-disk parse results are only valid for the parser code that produced them.
+    h = hashlib.sha256()
+    for name in ("friidrett_legacy.py", "minfriidrett.py", "util.py"):
+        h.update((Path(__file__).with_name(name)).read_bytes())
+    return h.digest()
+
+
+_PARSER_VERSION = _parser_version()
+
+
+def parse_page(
+    *,
+    html_bytes: bytes,
+    season: int,
+    gender: str,
+    source_url: str,
+    parsed_cache_dir: Optional[Path] = None,
+) -> list[ScrapedResult]:
+    """Parse friidrett.no Word-HTML pages (legacy) and return best-per-athlete rows per event.
+
+    With parsed_cache_dir set, rows are also pickled there keyed by body hash and parser
+    version, so warm runs skip parsing entirely.
+    """
+    key = (hashlib.sha256(html_bytes).digest(), int(season), gender, source_url)
+    if parsed_cache_dir is not None:
+        # The on-disk cache serves repeats, so the rows are not also held in memory.
+        rows = _load_parsed_rows(parsed_cache_dir, key)
+        if rows is None:
+            rows = _parse_page_uncached(html_bytes=html_bytes, season=season, gender=gender, source_url=source_url)
+            _store_parsed_rows(parsed_cache_dir, key, rows)
+        return rows
+
+    cached = _PARSED_CACHE.pop(key, None)
+    if cached is None:
+        cached = _parse_page_uncached(html_bytes=html_bytes, season=season, gender=gender, source_url=source_url)
+    _PARSED_CACHE[key] = cached
+    while len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+        del _PARSED_CACHE[next(iter(_PARSED_CACHE))]
+    return list(cached)
+
+
+def _parsed_cache_path(parsed_cache_dir: Path, key: tuple[bytes, int, str, str]) -> Path:
+    digest, season, gender, source_url = key
+    h = hashlib.sha256(digest)
+    h.update(source_url.encode("utf-8"))
+    version_dir = versioned_cache_dir(parsed_cache_dir, name="legacy", version=_PARSER_VERSION)
+    return version_dir / f"{season}_{gender.lower()}_{h.hexdigest()[:32]}.pkl"
+
+
+def _load_parsed_rows(parsed_cache_dir: Path, key: tuple[bytes, int, str, str]) -> Optional[list[ScrapedResult]]:
+    raw = _read_cache_file(_parsed_cache_path(parsed_cache_dir, key))
+    if raw is None:
+        return None
+    try:
+        rows = pickle.loads(raw)
+    except Exception:  # noqa: BLE001 - a broken cache entry just means re-parsing
+        return None
+    return rows if isinstance(rows, list) else None
+
+
+def _store_parsed_rows(parsed_cache_dir: Path, key: tuple[bytes, int, str, str], rows: list[ScrapedResult]) -> None:
+    path = _parsed_cache_path(parsed_cache_dir, key)
+    prepare_versioned_cache_dir(path.parent)
+    path.write_bytes(pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+def _is_pdf(data: bytes) -> bool:
+    # Same as data.lstrip().startswith(b"%PDF") without copying the body.
+    i = 0
+    n = len(data)
+    while i < n and data[i] in _ASCII_WHITESPACE:
+        i += 1
+    return data.startswith(b"%PDF", i)
+
+
+def _parse_page_uncached(*, html_bytes: bytes, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
+    if _is_pdf(html_bytes):
         # Kappgang PDFs (e.g. 2007) contain both genders in one document.
         return _parse_kappgang_pdf(pdf_bytes=html_bytes, season=season, gender=gender, source_url=source_url)
 
-    doc = html.fromstring(html_bytes)
-    if _looks_like_not_found_page(doc):
+    # Word-exported pages carry large conditional-comment blocks (<xml>, styles); drop them
+    # while parsing so they never become tree nodes. The parsers below need random access
+    # (sibling walks, the 2000 heading pass, the sectioned fallback), so the DOM itself stays.
+    doc = html.fromstring(html_bytes, parser=_html_parser())
+    if _looks_like_not_found_page(doc=doc, html_bytes=html_bytes):
         return []
 
     out: list[ScrapedResult] = []
 
-    for h2 in doc.xpath("//h2"):
-        heading_raw = (h2.text_content() or "").strip()
+    for h2 in doc.getroottree().iter("h2"):
+        heading_raw = _cell_text(h2).strip()
         event_no = _canonical_event_no(heading_raw, gender=gender)
         if not event_no:
             continue
@@ -337,19 +629,9 @@ def parse_page(*, html_bytes: bytes, season: int, gender: str, source_url: str)
             continue
 
         # 2010 usually has records+results, while 2008 often has a single table.
-        # Parse all candidates and keep the one with most valid result rows.
-        best: list[ScrapedResult] = []
-        for table in tables:
-            parsed = _parse_results_table(
-                table=table,
-                season=season,
-                gender=gender,
-                event_no=event_no,
-                source_url=source_url,
-            )
-            if len(parsed) > len(best):
-                best = parsed
-        out.extend(best)
+        out.extend(
+            _best_table_results(tables=tables, season=season, gender=gender, event_no=event_no, source_url=source_url)
+        )
 
     # 2000 pages often use event headings in p/b/h* nodes outside tables (not just h2),
     # so run an alternate heading-driven pass and prefer it when it recovers more rows.
@@ -365,11 +647,19 @@ def parse_page(*, html_bytes: bytes, season: int, gender: str, source_url: str)
     return _parse_sectioned_table_page(doc=doc, season=season, gender=gender, source_url=source_url)
 
 
-_WIND_CELL_RE = re.compile(r"^[+\-–−]?\s*\d+(?:[.,]\d+)?$")
-_PERF_WITH_TRAIL_WIND_RE = re.compile(r"^(?P<perf>.+?)\s+(?P<wind>[+\-–−]\d+(?:[.,]\d+)?)[#*]?$")
+_WIND_CELL_RE = re.compile(r"^[+\-–−—]?\s*\d+(?:[.,]\d+)?$")
+# Performance with an optional trailing wind ("10,52 +1,2"); always matches non-empty input.
+_PERF_SCAN_RE = re.compile(
+    r"""
+    ^(?P<perf>.+?)
+    (?:\s+(?P<wind>[+\-–−]\d+(?:[.,]\d+)?)[\#*]?)?
+    $
+    """,
+    re.VERBOSE,
+)
 _PLACEMENT_CELL_RE = re.compile(r"^\(?\d+[A-Za-z0-9/.-]*\)?[A-Za-z0-9/.-]*$")
 
-_HURDLE_HEIGHT_CM: dict[tuple[str, int], str] = {
+_HURDLE_HEIGHT_CM: Mapping[tuple[str, int], str] = MappingProxyType({
     ("Women", 60): "84,0",
     ("Women", 100): "84,0",
     ("Women", 200): "76,2",
@@ -379,28 +669,58 @@ _HURDLE_HEIGHT_CM: dict[tuple[str, int], str] = {
     ("Men", 200): "76,2",
     ("Men", 300): "91,4",
     ("Men", 400): "91,4",
-}
+})
 
-_STEEPLE_HEIGHT_CM: dict[tuple[str, int], str] = {
+_STEEPLE_HEIGHT_CM: Mapping[tuple[str, int], str] = MappingProxyType({
     ("Women", 2000): "76,2",
     ("Women", 3000): "76,2",
     ("Men", 2000): "91,4",
     ("Men", 3000): "91,4",
-}
+})
 
 
-def _parse_results_table(*, table: html.HtmlElement, season: int, gender: str, event_no: str, source_url: str) -> list[ScrapedResult]:
+# Club/venue/event strings repeat across thousands of rows; share one object per value.
+_INTERNED: dict[str, str] = {}
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    return _INTERNED.setdefault(s, s) if s else s
+
+
+def _best_table_results(
+    *, tables: list[html.HtmlElement], season: int, gender: str, event_no: str, source_url: str
+) -> Iterable[ScrapedResult]:
+    # A lone table streams straight into the caller's list. With several candidates, parse
+    # them all and keep the one with most valid result rows.
+    if len(tables) == 1:
+        return _iter_results_table(table=tables[0], season=season, gender=gender, event_no=event_no, source_url=source_url)
+    best: list[ScrapedResult] = []
+    for table in tables:
+        parsed = list(
+            _iter_results_table(table=table, season=season, gender=gender, event_no=event_no, source_url=source_url)
+        )
+        if len(parsed) > len(best):
+            best = parsed
+    return best
+
+
+def _iter_results_table(
+    *, table: html.HtmlElement, season: int, gender: str, event_no: str, source_url: str
+) -> Iterator[ScrapedResult]:
+    gender = sys.intern(gender)
+    event_no = _intern(event_no)
+    season_i = int(season)
     seen: set[int] = set()
-    out: list[ScrapedResult] = []
+    emitted = 0
 
     last_full: Optional[tuple[str, Optional[str], Optional[str]]] = None  # (name, club, birth_iso)
     known_by_surname: dict[str, tuple[str, Optional[str], Optional[str]]] = {}
-    known_ids_by_name: dict[str, dict[Optional[str], int]] = defaultdict(dict)
+    ids = _EventIds()
     rank = 0
     prev_clean: Optional[str] = None
 
-    for tr in table.xpath(".//tr"):
-        cells = _compact_cells([_norm_cell(c.text_content()) for c in tr.xpath("./td|./th")])
+    for tr in table.iter("tr"):
+        cells = _compact_cells([_norm_cell(_cell_text(c)) for c in tr.iterchildren("td", "th")])
         if not cells:
             continue
 
@@ -435,7 +755,7 @@ def _parse_results_table(*, table: html.HtmlElement, season: int, gender: str, e
             gender=gender,
             athlete_name=athlete_name,
             birth_iso=birth_iso,
-            known_ids_by_name=known_ids_by_name,
+            ids=ids,
         )
         if athlete_id is None:
             continue
@@ -446,44 +766,42 @@ def _parse_results_table(*, table: html.HtmlElement, season: int, gender: str, e
             athlete_name=athlete_name,
             birth_iso=birth_iso,
             athlete_id=athlete_id,
-            known_ids_by_name=known_ids_by_name,
+            ids=ids,
         )
 
         # Competition-style ranking: tied performances share the same rank
+        emitted += 1
         if cleaned.clean != prev_clean:
-            rank = len(out) + 1
+            rank = emitted
             prev_clean = cleaned.clean
 
-        out.append(
-            ScrapedResult(
-                season=int(season),
-                gender=gender,
-                event_no=event_no,
-                rank_in_list=rank,
-                performance_raw=cleaned.raw,
-                performance_clean=cleaned.clean,
-                wind=wind,
-                athlete_id=athlete_id,
-                athlete_name=athlete_name,
-                club_name=club_name,
-                birth_date=birth_iso,
-                nationality=nationality,
-                placement_raw=placement,
-                venue_city=venue_city,
-                stadium=None,
-                competition_id=None,
-                competition_name=competition_code,
-                result_date=result_date,
-                source_url=source_url,
-            )
+        # Positional, in ScrapedResult field order: no kwargs dict is built per row.
+        yield ScrapedResult(
+            season_i,  # season
+            gender,  # gender
+            event_no,  # event_no
+            rank,  # rank_in_list
+            cleaned.raw,  # performance_raw
+            cleaned.clean,  # performance_clean
+            wind,  # wind
+            athlete_id,  # athlete_id
+            athlete_name,  # athlete_name
+            _intern(club_name),  # club_name
+            birth_iso,  # birth_date
+            nationality,  # nationality
+            placement,  # placement_raw
+            _intern(venue_city),  # venue_city
+            None,  # stadium
+            None,  # competition_id
+            competition_code,  # competition_name
+            result_date,  # result_date
+            source_url,  # source_url
         )
 
-    return out
-
 
 def _parse_sectioned_table_page(*, doc: html.HtmlElement, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
     best: list[ScrapedResult] = []
-    for table in doc.xpath("//table"):
+    for table in doc.getroottree().iter("table"):
         parsed = _parse_sectioned_table(table=table, season=season, gender=gender, source_url=source_url)
         if len(parsed) > len(best):
             best = parsed
@@ -491,7 +809,7 @@ def _parse_sectioned_table_page(*, doc: html.HtmlElement, season: int, gender: s
 
 
 def _parse_heading_table_page(*, doc: html.HtmlElement, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
-    body_nodes = doc.xpath("/html/body//*")
+    body_nodes = _BODY_NODES_XP(doc)
     if not body_nodes:
         return []
 
@@ -504,10 +822,10 @@ def _parse_heading_table_page(*, doc: html.HtmlElement, season: int, gender: str
         tag = node.tag.lower()
         if tag not in {"h1", "h2", "h3", "p", "b"}:
             continue
-        if node.xpath("ancestor::table"):
+        if next(node.iterancestors("table"), None) is not None:
             continue
 
-        heading_raw = _norm_cell(node.text_content())
+        heading_raw = _norm_cell(_cell_text(node))
         if not heading_raw:
             continue
 
@@ -536,41 +854,49 @@ def _parse_heading_table_page(*, doc: html.HtmlElement, season: int, gender: str
         if not tables:
             continue
 
-        best: list[ScrapedResult] = []
-        for table in tables:
-            parsed = _parse_results_table(
-                table=table,
-                season=season,
-                gender=gender,
-                event_no=event_no,
-                source_url=source_url,
-            )
-            if len(parsed) > len(best):
-                best = parsed
-        out.extend(best)
+        out.extend(
+            _best_table_results(tables=tables, season=season, gender=gender, event_no=event_no, source_url=source_url)
+        )
 
     return out
 
 
 def _parse_sectioned_table(*, table: html.HtmlElement, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
+    gender = sys.intern(gender)
+    season_i = int(season)
     out: list[ScrapedResult] = []
-    seen_by_event: dict[str, set[int]] = defaultdict(set)
-    rank_by_event: dict[str, int] = defaultdict(int)
-    count_by_event: dict[str, int] = defaultdict(int)
+    seen_by_event: dict[str, set[int]] = {}
+    rank_by_event: dict[str, int] = {}
+    count_by_event: dict[str, int] = {}
     prev_clean_by_event: dict[str, str] = {}
     last_full_by_event: dict[str, tuple[str, Optional[str], Optional[str]]] = {}
-    known_by_event_surname: dict[str, dict[str, tuple[str, Optional[str], Optional[str]]]] = defaultdict(dict)
-    known_ids_by_event_name: dict[str, dict[str, dict[Optional[str], int]]] = defaultdict(dict)
+    known_by_event_surname: dict[str, dict[str, tuple[str, Optional[str], Optional[str]]]] = {}
+    ids_by_event: dict[str, _EventIds] = {}
 
+    # Rows cluster by event, so the per-event containers are bound to locals and
+    # only looked up again when a new section heading switches the event.
     current_event: Optional[str] = None
-    for tr in table.xpath(".//tr"):
-        cells = _compact_cells([_norm_cell(c.text_content()) for c in tr.xpath("./td|./th")])
+    seen: set[int] = set()
+    known_by_surname: dict[str, tuple[str, Optional[str], Optional[str]]] = {}
+    ids = _EventIds()
+    for tr in table.iter("tr"):
+        cells = _compact_cells([_norm_cell(_cell_text(c)) for c in tr.iterchildren("td", "th")])
         if not cells:
             continue
 
         heading = _section_heading_candidate(cells)
         if heading is not None:
-            current_event = _canonical_event_no(heading, gender=gender)
+            current_event = _intern(_canonical_event_no(heading, gender=gender))
+            if current_event:
+                seen = seen_by_event.get(current_event)
+                if seen is None:
+                    seen = seen_by_event[current_event] = set()
+                known_by_surname = known_by_event_surname.get(current_event)
+                if known_by_surname is None:
+                    known_by_surname = known_by_event_surname[current_event] = {}
+                ids = ids_by_event.get(current_event)
+                if ids is None:
+                    ids = ids_by_event[current_event] = _EventIds()
             continue
 
         if not current_event:
@@ -580,7 +906,7 @@ def _parse_sectioned_table(*, table: html.HtmlElement, season: int, gender: str,
             cells=cells,
             season=season,
             last_full=last_full_by_event.get(current_event),
-            known_by_surname=known_by_event_surname[current_event],
+            known_by_surname=known_by_surname,
         )
         if not parsed:
             continue
@@ -601,52 +927,54 @@ def _parse_sectioned_table(*, table: html.HtmlElement, season: int, gender: str,
         athlete_name, nationality = _extract_nationality(athlete_name)
         surname = _surname_token(athlete_name)
         if surname:
-            known_by_event_surname[current_event][surname] = (athlete_name, club_name, birth_iso)
+            known_by_surname[surname] = (athlete_name, club_name, birth_iso)
 
         athlete_id = _resolve_event_athlete_id(
             gender=gender,
             athlete_name=athlete_name,
             birth_iso=birth_iso,
-            known_ids_by_name=known_ids_by_event_name[current_event],
+            ids=ids,
         )
         if athlete_id is None:
             continue
-        if athlete_id in seen_by_event[current_event]:
+        if athlete_id in seen:
             continue
-        seen_by_event[current_event].add(athlete_id)
+        seen.add(athlete_id)
         _remember_event_athlete_id(
             athlete_name=athlete_name,
             birth_iso=birth_iso,
             athlete_id=athlete_id,
-            known_ids_by_name=known_ids_by_event_name[current_event],
+            ids=ids,
         )
 
         # Competition-style ranking: tied performances share the same rank
-        count_by_event[current_event] += 1
+        count = count_by_event.get(current_event, 0) + 1
+        count_by_event[current_event] = count
         if cleaned.clean != prev_clean_by_event.get(current_event):
-            rank_by_event[current_event] = count_by_event[current_event]
+            rank_by_event[current_event] = count
             prev_clean_by_event[current_event] = cleaned.clean
+        # Positional, in ScrapedResult field order (see _iter_results_table).
         out.append(
             ScrapedResult(
-                season=int(season),
-                gender=gender,
-                event_no=current_event,
-                rank_in_list=int(rank_by_event[current_event]),
-                performance_raw=cleaned.raw,
-                performance_clean=cleaned.clean,
-                wind=wind,
-                athlete_id=athlete_id,
-                athlete_name=athlete_name,
-                club_name=club_name,
-                birth_date=birth_iso,
-                nationality=nationality,
-                placement_raw=placement,
-                venue_city=venue_city,
-                stadium=None,
-                competition_id=None,
-                competition_name=competition_code,
-                result_date=result_date,
-                source_url=source_url,
+                season_i,  # season
+                gender,  # gender
+                current_event,  # event_no
+                int(rank_by_event[current_event]),  # rank_in_list
+                cleaned.raw,  # performance_raw
+                cleaned.clean,  # performance_clean
+                wind,  # wind
+                athlete_id,  # athlete_id
+                athlete_name,  # athlete_name
+                _intern(club_name),  # club_name
+                birth_iso,  # birth_date
+                nationality,  # nationality
+                placement,  # placement_raw
+                _intern(venue_city),  # venue_city
+                None,  # stadium
+                None,  # competition_id
+                competition_code,  # competition_name
+                result_date,  # result_date
+                source_url,  # source_url
             )
         )
 
@@ -668,8 +996,9 @@ def _parse_result_cells(
     if not cleaned or not cleaned.clean or not any(ch.isdigit() for ch in cleaned.clean):
         return None
 
-    has_wind = len(cells) >= 2 and _looks_like_wind(cells[1])
-    wind = _parse_wind(cells[1]) if has_wind else wind_from_perf
+    # cells are already _norm_cell'ed, so the *_norm helpers skip normalising them again.
+    has_wind = len(cells) >= 2 and _looks_like_wind_norm(cells[1])
+    wind = _parse_wind_norm(cells[1]) if has_wind else wind_from_perf
 
     idx_ath = _guess_athlete_index(cells=cells, has_wind=has_wind, last_full=last_full)
     if idx_ath is None or idx_ath >= len(cells):
@@ -719,20 +1048,30 @@ def _split_perf_and_wind(text: str) -> tuple[str, Optional[float]]:
     s = _norm_cell(text)
     if not s:
         return ("", None)
-    m = _PERF_WITH_TRAIL_WIND_RE.match(s)
-    if not m:
-        return (s, None)
-    return (m.group("perf").strip(), _parse_wind(m.group("wind")))
+    perf, wind = _PERF_SCAN_RE.match(s).group("perf", "wind")
+    if wind is None:
+        return (perf, None)
+    return (perf.strip(), _parse_wind(wind))
+
+
+def _cell_text(cell: html.HtmlElement) -> str:
+    # Table cells and heading nodes. Most are plain text; nested ones (<span>, <b>, <a>)
+    # are serialised with the text method, which gathers every descendant text node in
+    # one libxml2 pass instead of yielding them to Python one by one through itertext().
+    if len(cell) == 0:
+        return cell.text or ""
+    return etree.tostring(cell, method="text", encoding="unicode", with_tail=False)
 
 
 def _compact_cells(cells: list[str]) -> list[str]:
     # Some Word-exported tables (notably 2007 women) are heavily padded with empty columns.
     xs = ["" if c == "Ā" else c for c in cells]
-    while xs and not xs[0]:
-        xs.pop(0)
-    while xs and not xs[-1]:
-        xs.pop()
-    return xs
+    lo, hi = 0, len(xs)
+    while lo < hi and not xs[lo]:
+        lo += 1
+    while hi > lo and not xs[hi - 1]:
+        hi -= 1
+    return xs[lo:hi]
 
 
 def _guess_athlete_index(*, cells: list[str], has_wind: bool, last_full: Optional[tuple[str, Optional[str], Optional[str]]]) -> Optional[int]:
@@ -752,51 +1091,49 @@ def _is_likely_athlete_cell(text: str, *, last_full: Optional[tuple[str, Optiona
     s = _norm_cell(text)
     if not s:
         return False
-    if _looks_like_non_athlete_marker(s):
+    if _looks_like_non_athlete_marker_norm(s):
         return False
     if not any(ch.isalpha() for ch in s):
         return False
-    if _looks_like_wind(s) or _looks_like_placement(s):
+    # Not a wind cell past this point, so the placement pattern can be checked directly.
+    if _looks_like_wind_norm(s) or _PLACEMENT_CELL_RE.fullmatch(s):
         return False
-    if "," in s:
-        return True
-    if len(s.split()) >= 2:
+    # s is normalized: a single space separates words.
+    if "," in s or " " in s:
         return True
     return bool(last_full and _looks_like_abbrev_name(s))
 
 
-def _looks_like_non_athlete_marker(text: str) -> bool:
-    s = _norm_cell(text)
+_MARKER_PAREN_RE = re.compile(r"\([a-z0-9]{1,5}\)[a-z0-9]{0,4}")
+
+
+def _looks_like_non_athlete_marker_norm(s: str) -> bool:
     if not s:
         return False
     compact = s.replace(" ", "")
     low = compact.lower()
 
     # Seen on legacy pages as placement/qualification markers, not athlete names.
-    if re.fullmatch(r"\([a-z0-9]{1,5}\)[a-z0-9]{0,4}", low):
+    if _MARKER_PAREN_RE.fullmatch(low):
         return True
     if low in {"ok", "dns", "dnf", "nm", "nc", "dq"}:
         return True
-    if s.islower() and re.fullmatch(r"[a-z]{1,3}", low):
+    # One to three ASCII letters, checked with C-level str predicates.
+    if s.islower() and len(low) <= 3 and low.isascii() and low.isalpha():
         return True
     return False
 
 
 def _looks_like_abbrev_name(text: str) -> bool:
-    s = _norm_cell(text)
-    if not s or any(ch.isdigit() for ch in s) or _looks_like_non_athlete_marker(s):
-        return False
-    parts = s.split()
-    if len(parts) != 1:
+    token = _norm_cell(text)
+    if len(token) < 2 or " " in token or not token[0].isalpha():
         return False
-    token = parts[0]
-    if any(ch in ",()/[]{}" for ch in token):
+    # Letters plus hyphen/apostrophe only; this also rules out digits and brackets.
+    if not token.replace("-", "").replace("'", "").isalpha():
         return False
-    if not token[0].isalpha():
+    if not any(ch.islower() for ch in token[1:]):
         return False
-    if not all(ch.isalpha() or ch in "-'" for ch in token):
-        return False
-    return len(token) >= 2 and any(ch.islower() for ch in token[1:])
+    return not _looks_like_non_athlete_marker_norm(token)
 
 
 def _resolve_abbreviated_athlete(
@@ -832,10 +1169,10 @@ def _surname_token(name: str) -> Optional[str]:
 
 
 def _extract_placement(*, cells: list[str], idx_ath: int) -> Optional[str]:
-    if idx_ath > 1 and _looks_like_placement(cells[idx_ath - 1]):
-        return _none_if_empty(cells[idx_ath - 1])
-    if len(cells) > idx_ath + 2 and _looks_like_placement(cells[idx_ath + 2]):
-        return _none_if_empty(cells[idx_ath + 2])
+    if idx_ath > 1 and _looks_like_placement_norm(cells[idx_ath - 1]):
+        return cells[idx_ath - 1] or None
+    if len(cells) > idx_ath + 2 and _looks_like_placement_norm(cells[idx_ath + 2]):
+        return cells[idx_ath + 2] or None
     return None
 
 
@@ -851,11 +1188,11 @@ def _extract_comp_and_venue(*, cells: list[str], idx_ath: int, date_idx: Optiona
     if date_idx is None:
         return None, None
 
-    mids = [i for i in range(idx_ath + 2, date_idx) if _none_if_empty(cells[i])]
+    mids = [i for i in range(idx_ath + 2, date_idx) if cells[i]]
     if not mids:
         return None, None
 
-    non_place = [i for i in mids if not _looks_like_placement(cells[i])]
+    non_place = [i for i in mids if not _looks_like_placement_norm(cells[i])]
     if not non_place:
         return None, None
 
@@ -863,10 +1200,34 @@ def _extract_comp_and_venue(*, cells: list[str], idx_ath: int, date_idx: Optiona
     venue_city = _clean_venue(cells[venue_idx])
 
     comp_candidates = [i for i in non_place if i < venue_idx]
-    competition_code = _none_if_empty(cells[comp_candidates[-1]]) if comp_candidates else None
+    competition_code = (cells[comp_candidates[-1]] or None) if comp_candidates else None
     return competition_code, venue_city
 
 
+_DASH_SEP_RE = re.compile(r"\s+[–—-]\s+")
+_STAV_RE = re.compile(r"^STAV(?:\b|/)")
+_METER_RE = re.compile(r"^(?P<num>[\d ]+)\s*METER\b")
+_MILES_RE = re.compile(r"^(?P<num>\d+)\s*MILES?\b")
+
+# Field events keyed on the first four letters of the heading: (full prefix, men, women).
+# Throws are canonicalized to the same event names used by minfriidrett.
+_EVENT_BY_PREFIX: Mapping[str, tuple[str, str, str]] = MappingProxyType(
+    {
+        "HØYD": ("HØYDE", "Høyde", "Høyde"),
+        "HOYD": ("HOYDE", "Høyde", "Høyde"),
+        "LENG": ("LENGDE", "Lengde", "Lengde"),
+        "TRES": ("TRESTEG", "Tresteg", "Tresteg"),
+        "KULE": ("KULE", "Kule 7,26kg", "Kule 4,0kg"),
+        "DISK": ("DISKOS", "Diskos 2,0kg", "Diskos 1,0kg"),
+        "SLEG": ("SLEGGE", "Slegge 7,26kg/121,5cm", "Slegge 4,0kg/119,5cm"),
+        "SPYD": ("SPYD", "Spyd 800gram", "Spyd 600gram"),
+        "VEKT": ("VEKTKAST", "VektKast 15,88Kg", "VektKast 9,08Kg"),
+        "SUPE": ("SUPERVEKTKAST", "SuperVektKast 25,4Kg", "SuperVektKast 15,88Kg"),
+    }
+)
+
+
+@lru_cache(maxsize=1024)
 def _canonical_event_no(heading: str, *, gender: str) -> Optional[str]:
     text = _norm_cell(heading)
     if not text:
@@ -874,7 +1235,7 @@ def _canonical_event_no(heading: str, *, gender: str) -> Optional[str]:
 
     # Strip standards/notes, keep the Norwegian label (left of "/" if present)
     base = text.split("(")[0]
-    base = re.split(r"\s+[–—-]\s+", base, maxsplit=1)[0]
+    base = _DASH_SEP_RE.split(base, maxsplit=1)[0]
     base = base.split("/")[0]
     base = _norm_cell(base).upper()
 
@@ -889,47 +1250,31 @@ def _canonical_event_no(heading: str, *, gender: str) -> Optional[str]:
     if base_norm.startswith("KAST 5 KAMP") or base_norm.startswith("KAST 5-KAMP"):
         return "Kast 5 Kamp (Slegge-Kule-Diskos-Spyd-Vektkast)"
 
-    # Field events
-    if base.startswith("HØYDE") or base.startswith("HOYDE"):
-        return "Høyde"
-    if re.match(r"^STAV(?:\b|/)", base):
+    # Field events and throws: one dict lookup on the first four letters
+    hit = _EVENT_BY_PREFIX.get(base[:4])
+    if hit is not None and base.startswith(hit[0]):
+        return hit[1] if gender == "Men" else hit[2]
+    if _STAV_RE.match(base):
         return "Stav"
-    if base.startswith("LENGDE"):
-        return "Lengde"
-    if base.startswith("TRESTEG"):
-        return "Tresteg"
-
-    # Throws (canonicalize to the same event names used by minfriidrett)
-    if base.startswith("KULE"):
-        return "Kule 7,26kg" if gender == "Men" else "Kule 4,0kg"
-    if base.startswith("DISKOS"):
-        return "Diskos 2,0kg" if gender == "Men" else "Diskos 1,0kg"
-    if base.startswith("SLEGGE"):
-        return "Slegge 7,26kg/121,5cm" if gender == "Men" else "Slegge 4,0kg/119,5cm"
-    if base.startswith("SPYD"):
-        return "Spyd 800gram" if gender == "Men" else "Spyd 600gram"
-    if base.startswith("VEKTKAST"):
-        return "VektKast 15,88Kg" if gender == "Men" else "VektKast 9,08Kg"
-    if base.startswith("SUPERVEKTKAST"):
-        return "SuperVektKast 25,4Kg" if gender == "Men" else "SuperVektKast 15,88Kg"
 
     # Track events: distance, hurdles, steeplechase
-    m = re.match(r"^(?P<num>[\d ]+)\s*METER\b", base)
+    m = _METER_RE.match(base)
     if m:
         num = int(m.group("num").replace(" ", ""))
+        height_key = (gender, num)
         if "HEKK" in base:
-            height = _HURDLE_HEIGHT_CM.get((gender, num))
+            height = _HURDLE_HEIGHT_CM.get(height_key)
             if height:
                 return f"{num} meter hekk ({height}cm)"
             return f"{num} meter hekk"
         if "HINDER" in base:
-            height = _STEEPLE_HEIGHT_CM.get((gender, num))
+            height = _STEEPLE_HEIGHT_CM.get(height_key)
             if height:
                 return f"{num} meter hinder ({height}cm)"
             return f"{num} meter hinder"
         return f"{num} meter"
 
-    m = re.match(r"^(?P<num>\d+)\s*MILES?\b", base)
+    m = _MILES_RE.match(base)
     if m:
         miles = int(m.group("num"))
         return "1 mile" if miles == 1 else f"{miles} miles"
@@ -937,43 +1282,62 @@ def _canonical_event_no(heading: str, *, gender: str) -> Optional[str]:
     return None
 
 
+_ID_MASK = (1 << 63) - 1
+# sha1 state primed with the "friidrett|<gender>|" key prefix; copy() skips re-hashing it.
+_ID_HASHERS = MappingProxyType({g: hashlib.sha1(f"friidrett|{g}|".encode("utf-8")) for g in ("Men", "Women")})
+
+
+# The same athlete shows up in many events and seasons; the ids are persisted, so the
+# sha1 scheme stays and repeat lookups are served from the cache instead.
+@lru_cache(maxsize=16384)
 def _friidrett_athlete_id(*, gender: str, name: str, birth_date: Optional[str]) -> int:
-    key = f"friidrett|{gender}|{(name or '').strip().lower()}|{birth_date or ''}"
-    digest = hashlib.sha1(key.encode("utf-8")).digest()
-    n = int.from_bytes(digest[:8], "big") & ((1 << 63) - 1)
-    return -1 - int(n)
+    base = _ID_HASHERS.get(gender)
+    if base is None:
+        h = hashlib.sha1(f"friidrett|{gender}|".encode("utf-8"))
+    else:
+        h = base.copy()
+    h.update(f"{(name or '').strip().lower()}|{birth_date or ''}".encode("utf-8"))
+    return -1 - (int.from_bytes(h.digest()[:8], "big") & _ID_MASK)
 
 
+@lru_cache(maxsize=8192)
 def _athlete_name_key(name: str) -> str:
     return _norm_cell(name).lower()
 
 
+@dataclass(slots=True)
+class _EventIds:
+    """Athlete ids already assigned within one event table."""
+
+    by_full: dict[tuple[str, Optional[str]], int] = field(default_factory=dict)  # (name key, birth) -> id
+    births_by_name: dict[str, list[Optional[str]]] = field(default_factory=dict)  # births seen per name key
+
+
 def _resolve_event_athlete_id(
     *,
     gender: str,
     athlete_name: str,
     birth_iso: Optional[str],
-    known_ids_by_name: dict[str, dict[Optional[str], int]],
+    ids: _EventIds,
 ) -> Optional[int]:
     """Resolve athlete-id within one event table, reusing IDs when rows omit birth dates."""
     name_key = _athlete_name_key(athlete_name)
-    by_birth = known_ids_by_name.get(name_key, {})
-    if by_birth:
-        if birth_iso in by_birth:
-            return int(by_birth[birth_iso])
+    hit = ids.by_full.get((name_key, birth_iso))
+    if hit is not None:
+        return int(hit)
 
-        known_births = [b for b in by_birth.keys() if b is not None]
+    births = ids.births_by_name.get(name_key)
+    if births:
+        known_births = [b for b in births if b is not None]
         if birth_iso is None:
-            if None in by_birth:
-                return int(by_birth[None])
             if len(known_births) == 1:
-                return int(by_birth[known_births[0]])
+                return int(ids.by_full[(name_key, known_births[0])])
             if len(known_births) > 1:
                 # Ambiguous: same full name already seen with multiple birth dates in this event.
                 return None
         else:
-            if None in by_birth and not known_births:
-                return int(by_birth[None])
+            if None in births and not known_births:
+                return int(ids.by_full[(name_key, None)])
 
     return _friidrett_athlete_id(gender=gender, name=athlete_name, birth_date=birth_iso)
 
@@ -983,24 +1347,46 @@ def _remember_event_athlete_id(
     athlete_name: str,
     birth_iso: Optional[str],
     athlete_id: int,
-    known_ids_by_name: dict[str, dict[Optional[str], int]],
+    ids: _EventIds,
 ) -> None:
     name_key = _athlete_name_key(athlete_name)
-    by_birth = known_ids_by_name.setdefault(name_key, {})
-    by_birth.setdefault(birth_iso, int(athlete_id))
+    key = (name_key, birth_iso)
+    if key not in ids.by_full:
+        ids.by_full[key] = int(athlete_id)
+        ids.births_by_name.setdefault(name_key, []).append(birth_iso)
 
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+# Byte table for ASCII URLs: letters/digits kept (lowercased), everything else becomes "_".
+_SLUG_TABLE = bytes(
+    ord(chr(i).lower()) if chr(i).isascii() and chr(i).isalnum() else ord("_") for i in range(256)
+)
+
+
+@lru_cache(maxsize=1024)
 def _safe_cache_filename(url: str) -> str:
     digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
-    path = re.sub(r"^https?://", "", url)
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", path).strip("_").lower()
+    if url.startswith("http://"):
+        path = url[7:]
+    elif url.startswith("https://"):
+        path = url[8:]
+    else:
+        path = url
+    if path.isascii():
+        # Same slug as the regex below: split on "_" drops the collapsed runs and both ends.
+        slug = "_".join(filter(None, path.encode("ascii").translate(_SLUG_TABLE).decode("ascii").split("_")))
+    else:
+        slug = _SLUG_RE.sub("_", path).strip("_").lower()
     slug = slug[:80] if slug else "friidrett"
     return f"{slug}_{digest}.html"
 
 
+_NORM_TRANSLATE = str.maketrans({"\u00a0": " ", "Ā": " ", "\r": " ", "\n": " ", "\t": " "})
+
+
 def _norm_cell(text: str) -> str:
-    s = (text or "").replace("\u00a0", " ").replace("Ā", " ").replace("\r", " ").replace("\n", " ").strip()
-    return re.sub(r"\s+", " ", s)
+    # str.split() collapses whitespace runs and trims the ends in one C-level pass.
+    return " ".join((text or "").translate(_NORM_TRANSLATE).split())
 
 
 _NATIONALITY_RE = re.compile(r"\s*\(([A-Z]{3})\)\s*$")
@@ -1017,11 +1403,12 @@ def _extract_nationality(name: str) -> tuple[str, Optional[str]]:
     return (name, None)
 
 
+@lru_cache(maxsize=8192)
 def _split_name_and_club(text: str) -> tuple[str, Optional[str]]:
     s = _norm_cell(text)
     if not s:
         return ("", None)
-    if _looks_like_non_athlete_marker(s):
+    if _looks_like_non_athlete_marker_norm(s):
         return ("", None)
     # Some friidrett.no legacy pages contain placeholder rows where the athlete cell is e.g. "–––"
     # (no actual name). Treat any cell without letters as missing.
@@ -1033,15 +1420,17 @@ def _split_name_and_club(text: str) -> tuple[str, Optional[str]]:
     return (name.strip(), (rest.strip() or None))
 
 
-def _looks_like_wind(text: str) -> bool:
-    s = _norm_cell(text).replace("−", "-").replace("–", "-").replace("—", "-")
-    if not s or s == "-":
-        return False
+def _looks_like_wind_norm(s: str) -> bool:
+    # The pattern accepts every dash variant as sign, so no replace() pass is needed.
     return bool(_WIND_CELL_RE.match(s))
 
 
 def _parse_wind(text: str) -> Optional[float]:
-    s = _norm_cell(text).replace("−", "-").replace("–", "-").replace("—", "-")
+    return _parse_wind_norm(_norm_cell(text))
+
+
+def _parse_wind_norm(s: str) -> Optional[float]:
+    s = s.replace("−", "-").replace("–", "-").replace("—", "-")
     if not s or s == "-":
         return None
     try:
@@ -1050,26 +1439,24 @@ def _parse_wind(text: str) -> Optional[float]:
         return None
 
 
+# Season-relative dates: dd.mm, or a range 28/29.07 / 25-26.08 (first day in range).
+_DATE_SHORT_RE = re.compile(r"(?P<d>\d{1,2})(?P<range>[/-]\d{1,2})?\.(?P<m>\d{1,2})")
+
+
 def _parse_result_date(text: str, *, season: int) -> Optional[str]:
     s = _norm_cell(text).strip().rstrip(".")
     if not s:
         return None
 
-    # Full date dd.mm.yy / dd.mm.yyyy
-    full = parse_ddmmyy(s)
-    if full:
-        return full.isoformat()
+    m = _DATE_SHORT_RE.fullmatch(s)
 
-    # Date range: 28/29.07 or 25-26.08 (use first day in range)
-    m = re.fullmatch(r"(?P<d1>\d{1,2})(?:[/-]\d{1,2})\.(?P<m>\d{1,2})", s)
-    if m:
-        try:
-            return date(int(season), int(m.group("m")), int(m.group("d1"))).isoformat()
-        except ValueError:
-            return None
+    # Full date dd.mm.yy / dd.mm.yyyy. A plain dd.mm has only two parts and can never be
+    # one, but a range like 01/02.03 also reads as dd/mm.yy and the full date wins.
+    if m is None or m.group("range"):
+        full = parse_ddmmyy(s)
+        if full:
+            return full.isoformat()
 
-    # dd.mm (with or without trailing dot)
-    m = re.fullmatch(r"(?P<d>\d{1,2})\.(?P<m>\d{1,2})", s)
     if m:
         try:
             return date(int(season), int(m.group("m")), int(m.group("d"))).isoformat()
@@ -1094,22 +1481,24 @@ def _section_heading_candidate(cells: list[str]) -> Optional[str]:
     return None
 
 
-def _looks_like_placement(text: str) -> bool:
-    s = _norm_cell(text)
+def _looks_like_placement_norm(s: str) -> bool:
     if not s:
         return False
-    if _looks_like_wind(s):
+    if _looks_like_wind_norm(s):
         return False
     return bool(_PLACEMENT_CELL_RE.fullmatch(s))
 
 
+_BIRTH_SPACED_YY_RE = re.compile(r"^(\d{1,2}\.\d{1,2})\s+(\d{2})$")
+
+
 def _parse_birth_date(text: str) -> Optional[str]:
     s = _norm_cell(text)
     if not s:
         return None
 
     # Legacy pages sometimes use "dd.mm yy" for births.
-    s = re.sub(r"^(\d{1,2}\.\d{1,2})\s+(\d{2})$", r"\1.\2", s)
+    s = _BIRTH_SPACED_YY_RE.sub(r"\1.\2", s)
     dt = parse_ddmmyy(s)
     return dt.isoformat() if dt else None
 
@@ -1124,18 +1513,14 @@ def _clean_venue(text: str) -> Optional[str]:
 
 def _tables_until_next_h2(h2: html.HtmlElement) -> list[html.HtmlElement]:
     tables: list[html.HtmlElement] = []
-    seen: set[int] = set()
     sib = h2.getnext()
     while sib is not None:
-        if isinstance(sib.tag, str) and sib.tag.lower() == "h2":
-            break
-        candidates = [sib] if isinstance(sib.tag, str) and sib.tag.lower() == "table" else sib.xpath(".//table")
-        for table in candidates:
-            key = id(table)
-            if key in seen:
-                continue
-            seen.add(key)
-            tables.append(table)
+        if isinstance(sib.tag, str):
+            if sib.tag.lower() == "h2":
+                break
+            # iter() yields the sibling itself when it is a table, plus any nested tables.
+            # Sibling subtrees are disjoint, so no dedup is needed.
+            tables.extend(sib.iter("table"))
         sib = sib.getnext()
     return tables
 
@@ -1147,17 +1532,35 @@ _KAPPGANG_RESULT_RE = re.compile(
 )
 
 
+# Kappgang PDFs hold both genders and are requested once per gender, one right after the
+# other; keep the split rows of the last few PDFs.
+_KAPPGANG_PARSED: dict[tuple[bytes, int, str], dict[str, list[ScrapedResult]]] = {}
+_KAPPGANG_PARSED_SIZE = 2
+
+
 def _parse_kappgang_pdf(*, pdf_bytes: bytes, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
+    key = (hashlib.md5(pdf_bytes).digest(), int(season), source_url)
+    by_gender = _KAPPGANG_PARSED.pop(key, None)
+    if by_gender is None:
+        by_gender = _parse_kappgang_pdf_both(pdf_bytes=pdf_bytes, season=season, source_url=source_url)
+    _KAPPGANG_PARSED[key] = by_gender
+    while len(_KAPPGANG_PARSED) > _KAPPGANG_PARSED_SIZE:
+        del _KAPPGANG_PARSED[next(iter(_KAPPGANG_PARSED))]
+    return list(by_gender.get(gender, ()))
+
+
+def _parse_kappgang_pdf_both(*, pdf_bytes: bytes, season: int, source_url: str) -> dict[str, list[ScrapedResult]]:
     text = _pdf_to_text(pdf_bytes)
     if not text:
-        return []
+        return {}
 
-    out: list[ScrapedResult] = []
-    current_event: Optional[str] = None
-    rank_by_event: dict[str, int] = defaultdict(int)
-    count_by_event: dict[str, int] = defaultdict(int)
-    prev_clean_by_event: dict[str, str] = {}
-    seen_by_event: dict[str, set[int]] = defaultdict(set)
+    out: dict[str, list[ScrapedResult]] = {"Men": [], "Women": []}
+    gender = "Men"
+    current_event: Optional[tuple[str, str]] = None  # (gender, event_no)
+    rank_by_event: dict[tuple[str, str], int] = defaultdict(int)
+    count_by_event: dict[tuple[str, str], int] = defaultdict(int)
+    prev_clean_by_event: dict[tuple[str, str], str] = {}
+    seen_by_event: dict[tuple[str, str], set[int]] = defaultdict(set)
 
     for raw_line in text.splitlines():
         line = _norm_cell(raw_line)
@@ -1166,18 +1569,22 @@ def _parse_kappgang_pdf(*, pdf_bytes: bytes, season: int, gender: str, source_ur
         if line.startswith("MiKTeX requires Windows"):
             continue
 
-        sec = _KAPPGANG_SECTION_RE.match(line)
+        # Cheap end-of-line checks gate the backtracking regexes: a section heading ends
+        # with its "(...)" note and a result row with its dd.mm date. Most lines of the
+        # layout text are neither, so they never reach the regex engine.
+        last = line[-1]
+        sec = _KAPPGANG_SECTION_RE.match(line) if last == ")" else None
         if sec:
-            sec_gender = "Men" if sec.group("label").lower().startswith("menn") else "Women"
-            if sec_gender != gender:
-                current_event = None
-                continue
-            current_event = _kappgang_event_no(sec.group("event"))
+            gender = "Men" if sec.group("label").lower().startswith("menn") else "Women"
+            event_no = _kappgang_event_no(sec.group("event"))
+            current_event = (gender, event_no) if event_no else None
             continue
 
         if not current_event:
             continue
 
+        if not last.isdecimal() or "(" not in line:
+            continue
         m = _KAPPGANG_RESULT_RE.match(line)
         if not m:
             continue
@@ -1204,11 +1611,11 @@ def _parse_kappgang_pdf(*, pdf_bytes: bytes, season: int, gender: str, source_ur
         if cleaned.clean != prev_clean_by_event.get(current_event):
             rank_by_event[current_event] = count_by_event[current_event]
             prev_clean_by_event[current_event] = cleaned.clean
-        out.append(
+        out[gender].append(
             ScrapedResult(
                 season=int(season),
                 gender=gender,
-                event_no=current_event,
+                event_no=current_event[1],
                 rank_in_list=int(rank_by_event[current_event]),
                 performance_raw=cleaned.raw,
                 performance_clean=cleaned.clean,
@@ -1231,16 +1638,21 @@ def _parse_kappgang_pdf(*, pdf_bytes: bytes, season: int, gender: str, source_ur
     return out
 
 
+_KAPPGANG_KM_RE = re.compile(r"(?P<km>\d+)\s*km\b")
+_KAPPGANG_M_RE = re.compile(r"(?P<m>\d+)\s*m(?:eter)?\b")
+
+
+@lru_cache(maxsize=1024)
 def _kappgang_event_no(raw_event: str) -> Optional[str]:
     e = _norm_cell(raw_event).lower()
     if not e or "innend" in e:
         return None
 
-    m = re.search(r"(?P<km>\d+)\s*km\b", e)
+    m = _KAPPGANG_KM_RE.search(e)
     if m:
         return f"Kappgang {int(m.group('km'))} km"
 
-    m = re.search(r"(?P<m>\d+)\s*m(?:eter)?\b", e)
+    m = _KAPPGANG_M_RE.search(e)
     if m:
         return f"Kappgang {int(m.group('m'))} meter"
 
@@ -1252,6 +1664,22 @@ def _pdf_to_text(pdf_bytes: bytes) -> Optional[str]:
     if not pdftotext:
         return None
 
+    # Poppler's pdftotext reads the PDF from stdin and writes text to stdout when both
+    # paths are "-", which skips the temp-file round trip. Older builds (xpdf) can't read
+    # stdin, so fall back to files if the piped run fails.
+    try:
+        proc = subprocess.run(
+            [pdftotext, "-layout", "-enc", "UTF-8", "-", "-"],
+            input=pdf_bytes,
+            check=True,
+            capture_output=True,
+        )
+    except Exception:
+        proc = None
+    if proc is not None and proc.stdout:
+        # Same newline handling as read_text() on the file path below.
+        return proc.stdout.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
     with tempfile.TemporaryDirectory(prefix="nfwa_pdf_") as tmp:
         tmp_dir = Path(tmp)
         in_pdf = tmp_dir / "in.pdf"
@@ -1274,17 +1702,26 @@ def _pdf_to_text(pdf_bytes: bytes) -> Optional[str]:
 
 
 def _parse_ddmmyy_compact(token: str) -> Optional[date]:
-    t = _norm_cell(token)
-    if not re.fullmatch(r"\d{6}", t):
+    # Callers pass the bare \d{6} regex group, so normalising is only needed off the fast path.
+    t = token if len(token) == 6 and token.isdecimal() else _norm_cell(token)
+    if len(t) != 6 or not t.isdecimal():
         return None
-    return parse_ddmmyy(f"{t[0:2]}.{t[2:4]}.{t[4:6]}")
+    # parse_ddmmyy reads compact ddmmyy directly, with the shared two-digit year rule.
+    return parse_ddmmyy(t)
+
+
+_TITLE_TEXT_XP = etree.XPath("//title/text()")
+_AUTH_HOST_RE = re.compile(rb"microsoftonline\.com", re.IGNORECASE)
+_AUTH_PATH_RE = re.compile(rb"oauth2/authorize", re.IGNORECASE)
 
 
-def _looks_like_not_found_page(doc: html.HtmlElement) -> bool:
-    title = _norm_cell(" ".join(doc.xpath("//title/text()"))).lower()
+def _looks_like_not_found_page(*, doc: html.HtmlElement, html_bytes: bytes) -> bool:
+    title = _norm_cell(" ".join(_TITLE_TEXT_XP(doc))).lower()
     if "vi fant ikke siden" in title:
         return True
+    # A login link in an href is fine; only a page whose text points at the login is a redirect.
+    # The byte scan just spares the text_content() walk on ordinary pages.
+    if not (_AUTH_HOST_RE.search(html_bytes) and _AUTH_PATH_RE.search(html_bytes)):
+        return False
     body = _norm_cell(doc.text_content()).lower()
-    if "microsoftonline.com" in body and "oauth2/authorize" in body:
-        return True
-    return False
+    return "microsoftonline.com" in body and "oauth2/authorize" in body
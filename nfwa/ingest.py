@@ -1,26 +1,50 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import sqlite3
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from queue import Queue
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from . import db as results_db
 from .config import SOURCES, Source
 from .event_mapping import infer_orientation, map_event_to_wa
 from .friidrett_legacy import fetch_page as fetch_friidrett_page
+from .friidrett_legacy import fetch_pages as fetch_friidrett_pages
 from .friidrett_legacy import pages_for_years as friidrett_pages_for_years
 from .friidrett_legacy import parse_page as parse_friidrett_page
-from .kondis import fetch_kondis_stats, pages_for_years, parse_kondis_stats
-from .minfriidrett import build_landsstatistikk_url, fetch_landsstatistikk, parse_landsstatistikk
+from .kondis import KondisPage, KondisResult, fetch_kondis_stats, pages_for_years, parse_kondis_stats
+from .minfriidrett import ScrapedResult, build_landsstatistikk_url, fetch_landsstatistikk, parse_landsstatistikk
 from .old_data import parse_old_data_dir
 from .util import normalize_performance, performance_to_value
-from .wa import ensure_wa_poeng_importable, wa_event_meta, wa_event_names
+from .wa import WaEventMeta, ensure_wa_poeng_importable, shared_wa_event_names, wa_event_meta, wa_scoring_key
+
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 _JUMP_CM_RE = re.compile(r"^\d{3,4}$")
 _MIXED_DOT_COMMA_RE = re.compile(r"^\d+\.\d{1,2},\d{1,2}$")
+# Display form of jump heights given in whole cm ("215" -> "2,15"), over each event's plausible range.
+_JUMP_CM_DISPLAY = {
+    "HJ": {cm: f"{cm // 100},{cm % 100:02d}" for cm in range(100, 281)},
+    "PV": {cm: f"{cm // 100},{cm % 100:02d}" for cm in range(100, 701)},
+}
+_MIXED_SEPARATORS = (".", ",", ":")
 
 
 def _display_raw_performance(
@@ -31,14 +55,17 @@ def _display_raw_performance(
         return performance_raw
 
     # Keep display format aligned with long-event interpretation when source mixes
-    # dot+comma separators (e.g. "3.12,43" -> "3.12.43").
-    norm = (performance_norm or "").strip()
-    if norm and _MIXED_DOT_COMMA_RE.fullmatch(raw) and norm.count(":") >= 2 and "." not in norm:
-        return norm.replace(":", ".")
-
-    if wa_event not in {"HJ", "PV"}:
+    # dot+comma separators (e.g. "3.12,43" -> "3.12.43"). Only raw values holding both
+    # separators, with a normalised h:mm:ss time, can take this branch.
+    if performance_norm and "," in raw and "." in raw:
+        norm = performance_norm.strip()
+        if norm.count(":") >= 2 and "." not in norm and _MIXED_DOT_COMMA_RE.fullmatch(raw):
+            return norm.replace(":", ".")
+
+    jump_display = _JUMP_CM_DISPLAY.get(wa_event)
+    if jump_display is None:
         return performance_raw
-    if any(sep in raw for sep in (".", ",", ":")):
+    if any(sep in raw for sep in _MIXED_SEPARATORS):
         return performance_raw
     if not _JUMP_CM_RE.fullmatch(raw):
         return performance_raw
@@ -46,13 +73,296 @@ def _display_raw_performance(
         cm = int(raw)
     except ValueError:
         return performance_raw
+    return jump_display.get(cm, performance_raw)
 
-    if wa_event == "HJ" and not (100 <= cm <= 280):
-        return performance_raw
-    if wa_event == "PV" and not (100 <= cm <= 700):
-        return performance_raw
 
-    return f"{cm / 100:.2f}".replace(".", ",")
+@lru_cache(maxsize=65536)
+def _normalized_performance(performance: str, orientation: str, wa_event: str | None) -> tuple[str, Optional[float]]:
+    """normalize_performance plus performance_to_value, memoised.
+
+    Both are pure string work, and a full sync sees the same few thousand marks over and over
+    (round times, common distances), so most rows are a single dict hit.
+    """
+    perf_norm = normalize_performance(performance=performance, orientation=orientation, wa_event=wa_event)
+    return perf_norm, performance_to_value(perf_norm) if perf_norm else None
+
+
+# Kondis event names (lowercased prefix) whose marks are normalised as a WA event even when unmapped.
+_KONDIS_EVENT_HINTS = {"halvmaraton": "HM"}
+
+
+@lru_cache(maxsize=1024)
+def _kondis_event_hint(event_no: str) -> Optional[str]:
+    lowered = event_no.lower()
+    for prefix, wa_event in _KONDIS_EVENT_HINTS.items():
+        if lowered.startswith(prefix):
+            return wa_event
+    return None
+
+
+def _make_event_resolver(*, wa_db_path: Path) -> Callable[[str, str, str], tuple[Optional[str], str]]:
+    """Per-sync memo of (wa_event, orientation) for a source event name.
+
+    Rows only span O(events x genders) distinct keys, so each mapping is computed and each
+    WA-DB metadata query (a fresh SQLite connection) runs once per key instead of per row,
+    and a row needs a single cache hit for both values. WA event names are read lazily, per
+    gender, from the process-wide shared_wa_event_names.
+    """
+
+    @lru_cache(maxsize=None)
+    def event_meta(gender: str, event: str) -> Optional[WaEventMeta]:
+        return wa_event_meta(wa_db_path=wa_db_path, gender=gender, event=event)
+
+    @lru_cache(maxsize=None)
+    def resolve_event(events_gender: str, event_no: str, gender: str) -> tuple[Optional[str], str]:
+        wa_events = shared_wa_event_names(wa_db_path=wa_db_path, gender=events_gender)
+        wa_event = map_event_to_wa(event_no=event_no, gender=gender, wa_events=wa_events)
+        meta = event_meta(gender, wa_event) if wa_event else None
+        return wa_event, meta.orientation if meta else infer_orientation(event_no)
+
+    return resolve_event
+
+
+def _make_id_lookups(
+    *, con: sqlite3.Connection
+) -> tuple[Callable[[Optional[str]], Optional[int]], Callable[[str, str, Optional[str], str], int]]:
+    """Per-sync memos in front of get_or_create_club/get_or_create_event.
+
+    A page has thousands of rows but only a few hundred clubs and a few dozen events. An event
+    upsert is only repeated when its wa_event/orientation differ from the previous call for the
+    same (gender, name_no), so the events table ends up exactly as with one upsert per row.
+    """
+    clubs: dict[Optional[str], Optional[int]] = {}
+    events: dict[tuple[str, str], tuple[Optional[str], str, int]] = {}
+
+    def club_id_for(club_name: Optional[str]) -> Optional[int]:
+        if club_name in clubs:
+            return clubs[club_name]
+        club_id = clubs[club_name] = results_db.get_or_create_club(con=con, club_name=club_name)
+        return club_id
+
+    def event_id_for(gender: str, name_no: str, wa_event: Optional[str], orientation: str) -> int:
+        key = (gender, name_no)
+        last = events.get(key)
+        if last is not None and last[0] == wa_event and last[1] == orientation:
+            return last[2]
+        event_id = results_db.get_or_create_event(
+            con=con, gender=gender, name_no=name_no, wa_event=wa_event, orientation=orientation
+        )
+        events[key] = (wa_event, orientation, event_id)
+        return event_id
+
+    return club_id_for, event_id_for
+
+
+def _make_page_committer(*, con: sqlite3.Connection, every: int) -> Callable[[], None]:
+    """Call once per finished page; commits every ``every`` pages instead of after each one.
+
+    A page's DELETE, upserts and manifest row always share a transaction, so an interrupted
+    sync loses whole pages only, and those are simply re-ingested on the next run. Callers
+    commit whatever is left when the loop ends.
+    """
+    pending = 0
+
+    def page_done() -> None:
+        nonlocal pending
+        pending += 1
+        if pending >= every:
+            con.commit()
+            pending = 0
+
+    return page_done
+
+
+class _ScoringThread:
+    """WA scoring on one background thread, which owns its own ScoreCalculator.
+
+    The calculator is a foreign library that may not be thread-safe, so it is created, used and
+    closed on that thread only. submit() returns a Future, which lets the ingest loop keep mapping
+    and writing rows while cache misses are scored.
+    """
+
+    def __init__(self, calculator_cls, wa_db_path: Path, *, maxsize: int = 1024) -> None:
+        self._jobs: Queue[Optional[tuple[Future, tuple[str, str, str]]]] = Queue(maxsize=maxsize)
+        self._started: Future[None] = Future()
+        self._thread = threading.Thread(
+            target=self._run, args=(calculator_cls, wa_db_path), name="wa-scoring", daemon=True
+        )
+
+    def __enter__(self) -> _ScoringThread:
+        self._thread.start()
+        self._started.result()  # re-raises a calculator that failed to open
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._jobs.put(None)
+        self._thread.join()
+
+    def submit(self, gender: str, event: str, performance: str) -> Future:
+        future: Future = Future()
+        self._jobs.put((future, (gender, event, performance)))
+        return future
+
+    def _run(self, calculator_cls, wa_db_path: Path) -> None:
+        try:
+            with calculator_cls(wa_db_path) as calc:
+                self._started.set_result(None)
+                while (job := self._jobs.get()) is not None:
+                    future, args = job
+                    try:
+                        future.set_result(calc.points_for_performance(*args))
+                    except Exception as exc:  # noqa: BLE001 - handed to the waiting row
+                        future.set_exception(exc)
+        except BaseException as exc:  # noqa: BLE001 - surfaced by __enter__
+            if self._started.done():
+                raise
+            self._started.set_exception(exc)
+
+
+def _make_points_lookup(
+    *, con: sqlite3.Connection, scorer: _ScoringThread, scoring_key: str
+) -> tuple[Callable[[str, str, str], tuple[str, str, str]], Callable[[tuple[str, str, str]], tuple[Optional[int], Optional[int], Optional[str]]]]:
+    """(request_points, points_for) over a memo of WA points, kept in memory and in the results DB.
+
+    request_points(gender, event, performance) queues a cache miss on the scoring thread and returns
+    the key to hand to points_for, which waits for it and returns (points, exact, error).
+
+    Performances repeat heavily across pages and seasons, and the table persists between runs, so a
+    warm re-sync skips WA scoring entirely. Failures are only memoised for this sync: the error text
+    is formatted once per distinct input rather than once per row, and never written to the cache.
+    """
+    known: dict[tuple[str, str, str], tuple[Optional[int], Optional[int], Optional[str]]] = {
+        key: (points, exact, None)
+        for key, (points, exact) in results_db.load_wa_points_cache(con=con, scoring_key=scoring_key).items()
+    }
+    pending: dict[tuple[str, str, str], Future] = {}
+
+    def request_points(gender: str, event: str, performance: str) -> tuple[str, str, str]:
+        key = (gender, event, performance)
+        if key not in known and key not in pending:
+            pending[key] = scorer.submit(gender, event, performance)
+        return key
+
+    def points_for(key: tuple[str, str, str]) -> tuple[Optional[int], Optional[int], Optional[str]]:
+        hit = known.get(key)
+        if hit is None:
+            try:
+                res = pending.pop(key).result()
+                points, exact = int(res["points"]), 1 if bool(res["exact"]) else 0
+            except Exception as exc:  # noqa: BLE001 - loggable error detail
+                hit = known[key] = (None, None, f"{type(exc).__name__}: {exc}")
+                return hit
+            hit = known[key] = (points, exact, None)
+            gender, event, performance = key
+            results_db.store_wa_points(
+                con=con, scoring_key=scoring_key, gender=gender, wa_event=event, performance=performance,
+                points=points, exact=exact,
+            )
+        return hit
+
+    return request_points, points_for
+
+
+class _PoliteSession(requests.Session):
+    """Session that keeps one request in flight per host, spaced at least ``delay_s`` apart.
+
+    Replaces the fixed sleep after every page: cache hits never touch the session, so they
+    no longer wait, while real requests stay as polite as before even from worker threads.
+    """
+
+    def __init__(self, delay_s: float) -> None:
+        super().__init__()
+        # Same retry/backoff as the fetch modules' shared sessions; retries stay inside the host's turn.
+        adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3))
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self._delay_s = max(0.0, delay_s)
+        self._hosts_lock = threading.Lock()
+        self._host_locks: dict[str, threading.Lock] = {}
+        self._host_ready_at: dict[str, float] = {}
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            wait = self._host_ready_at.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                return super().request(method, url, *args, **kwargs)
+            finally:
+                self._host_ready_at[host] = time.monotonic() + self._delay_s
+
+
+def _prefetch(work: Callable[[_T], _R], jobs: Sequence[_T], *, window: int = 4) -> Iterator[tuple[_T, Future[_R]]]:
+    """Yield ``(job, future)`` in input order, keeping up to ``window`` jobs running ahead.
+
+    The caller writes one page while the next ones download (and parse, see _parse_pool);
+    DB work stays on the calling thread.
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, window))
+    try:
+        todo = iter(jobs)
+        pending: deque[tuple[_T, Future[_R]]] = deque()
+        for job in todo:
+            pending.append((job, pool.submit(work, job)))
+            if len(pending) >= window:
+                break
+        while pending:
+            job, fut = pending.popleft()
+            nxt = next(todo, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(work, nxt)))
+            yield job, fut
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    """Worker processes for HTML parsing.
+
+    Parsing is CPU-bound lxml/regex work that threads cannot overlap under the GIL; in worker
+    processes it runs alongside the main process, which scores and writes the rows.
+    """
+    return ProcessPoolExecutor(max_workers=max(1, os.cpu_count() or 1))
+
+
+# Module-level so they can be sent to _parse_pool workers; parse_* return lazy iterables.
+def _parse_landsstatistikk_rows(html_bytes: bytes, season: int, gender: str, source_url: str) -> list[ScrapedResult]:
+    return list(parse_landsstatistikk(html_bytes=html_bytes, season=season, gender=gender, source_url=source_url))
+
+
+def _parse_kondis_rows(html_bytes: bytes, page: KondisPage, parsed_cache_dir: Path) -> list[KondisResult]:
+    return list(parse_kondis_stats(html_bytes=html_bytes, page=page, parsed_cache_dir=parsed_cache_dir))
+
+
+def _ingest_version() -> bytes:
+    # Part of every page signature: a change to the event mapping, normalisation, club/athlete
+    # handling or scoring of parsed rows re-ingests pages whose parsed rows are unchanged.
+    h = hashlib.sha256()
+    for name in ("ingest.py", "db.py", "event_mapping.py", "util.py", "wa.py"):
+        h.update((Path(__file__).with_name(name)).read_bytes())
+    return h.digest()
+
+
+_INGEST_VERSION = _ingest_version()
+
+
+def _page_signature(*, parsed_rows: Sequence[object], scoring_key: str) -> str:
+    """Hash of everything a page's DB rows are derived from: parsed rows, ingest version and WA tables.
+
+    Hashing the parsed rows rather than the raw HTML also covers parser changes and the
+    manual Kondis corrections, which replace the page content entirely.
+    """
+    digest = hashlib.sha256(_INGEST_VERSION)
+    digest.update(f"|{scoring_key}|".encode())
+    digest.update(repr(parsed_rows).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+# The results one landsstatistikk or legacy page (source_url, gender, season) rebuilds.
+_PAGE_RESULTS_WHERE = "source_url = ? AND gender = ? AND season = ?"
 
 
 @dataclass(frozen=True)
@@ -63,6 +373,166 @@ class SyncSummary:
     wa_points_ok: int
     wa_points_failed: int
     wa_points_missing: int
+    pages_skipped: int = 0  # unchanged since the last ingest (see page_manifest)
+
+
+@dataclass(slots=True)
+class _SyncStats:
+    pages: int = 0
+    pages_skipped: int = 0
+    rows_seen: int = 0
+    rows_inserted: int = 0
+    wa_ok: int = 0
+    wa_failed: int = 0
+    wa_missing: int = 0
+
+    def summary(self) -> SyncSummary:
+        return SyncSummary(
+            pages=self.pages,
+            rows_seen=self.rows_seen,
+            rows_inserted=self.rows_inserted,
+            wa_points_ok=self.wa_ok,
+            wa_points_failed=self.wa_failed,
+            wa_points_missing=self.wa_missing,
+            pages_skipped=self.pages_skipped,
+        )
+
+
+@dataclass(frozen=True)
+class _RowSink:
+    """Per-sync lookups shared by every page's _ingest_rows call."""
+
+    con: sqlite3.Connection
+    resolve_event: Callable[[str, str, str], tuple[Optional[str], str]]
+    club_id_for: Callable[[Optional[str]], Optional[int]]
+    event_id_for: Callable[[str, str, Optional[str], str], int]
+    request_points: Callable[[str, str, str], tuple[str, str, str]]
+    points_for: Callable[[tuple[str, str, str]], tuple[Optional[int], Optional[int], Optional[str]]]
+
+
+def _make_row_sink(*, con: sqlite3.Connection, scorer: _ScoringThread, wa_db_path: Path, scoring_key: str) -> _RowSink:
+    club_id_for, event_id_for = _make_id_lookups(con=con)
+    request_points, points_for = _make_points_lookup(con=con, scorer=scorer, scoring_key=scoring_key)
+    return _RowSink(
+        con=con,
+        resolve_event=_make_event_resolver(wa_db_path=wa_db_path),
+        club_id_for=club_id_for,
+        event_id_for=event_id_for,
+        request_points=request_points,
+        points_for=points_for,
+    )
+
+
+def _ingest_rows(
+    *,
+    sink: _RowSink,
+    stats: _SyncStats,
+    rows: Sequence[ScrapedResult | KondisResult],
+    events_gender: Optional[str],
+    source_type: str,
+    replaces: tuple[str, Sequence[object]],
+    with_competitions: bool = False,
+    kondis_event_hints: bool = False,
+) -> None:
+    """Map, score and store one page of parsed rows; the one ingest loop every source goes through.
+
+    replaces is the (WHERE clause, params) of the results the page rebuilds: afterwards they are exactly
+    this page's rows (see results_db.replace_results). events_gender selects the WA event list used for mapping (None: each row's own gender).
+    with_competitions stores competition ids and stadiums (landsstatistikk rows carry them), and
+    kondis_event_hints normalises unmapped marks by _KONDIS_EVENT_HINTS (e.g. "Halvmaraton" as HM times).
+    """
+    con = sink.con
+    resolve_event = sink.resolve_event
+    club_id_for = sink.club_id_for
+    event_id_for = sink.event_id_for
+    request_points = sink.request_points
+
+    athlete_rows: list[tuple] = []
+    result_rows: list[tuple] = []
+    scored: list[tuple[int, tuple[str, str, str]]] = []  # (index in result_rows, points key)
+    stats.rows_seen += len(rows)
+    # Exact duplicate rows (same athlete, mark, date, placement, ...) would only repeat the same upserts.
+    for row in dict.fromkeys(rows):
+        wa_event, orientation = resolve_event(events_gender or row.gender, row.event_no, row.gender)
+
+        athlete_rows.append((row.athlete_id, row.gender, row.athlete_name, row.birth_date, row.nationality or "NOR"))
+        club_id = club_id_for(row.club_name)
+        event_id = event_id_for(row.gender, row.event_no, wa_event, orientation)
+        competition_id: Optional[int] = None
+        stadium: Optional[str] = None
+        if with_competitions:
+            competition_id = results_db.upsert_competition(
+                con=con,
+                competition_id=row.competition_id,
+                name=row.competition_name,
+                city=row.venue_city,
+                stadium=row.stadium,
+            )
+            stadium = row.stadium
+
+        wa_event_hint = wa_event
+        if wa_event_hint is None and kondis_event_hints:
+            wa_event_hint = _kondis_event_hint(row.event_no)
+
+        if row.performance_clean:
+            perf_norm, value = _normalized_performance(row.performance_clean, orientation, wa_event_hint)
+        else:
+            perf_norm, value = "", None
+
+        # Points are filled in below, once the scoring thread has caught up.
+        if perf_norm and wa_event:
+            scored.append((len(result_rows), request_points(row.gender, wa_event, perf_norm)))
+
+        result_rows.append(
+            (
+                row.season,
+                row.gender,
+                event_id,
+                row.athlete_id,
+                club_id,
+                row.rank_in_list,
+                _display_raw_performance(
+                    performance_raw=row.performance_raw,
+                    wa_event=wa_event,
+                    performance_norm=perf_norm,
+                ),  # performance_raw
+                perf_norm or None,  # performance_clean
+                value,
+                row.wind,
+                row.placement_raw,
+                competition_id,
+                row.competition_name,
+                row.venue_city,
+                stadium,
+                row.result_date,
+                None,  # wa_points
+                None,  # wa_exact
+                wa_event,
+                None,  # wa_error
+                row.source_url,
+                source_type,
+            )
+        )
+
+    results_db.upsert_athletes(con=con, rows=athlete_rows)
+
+    points_for = sink.points_for
+    wa_failed = 0
+    for i, key in scored:
+        wa_points, wa_exact, wa_error = points_for(key)
+        if wa_error is not None:
+            wa_failed += 1
+        result = result_rows[i]
+        result_rows[i] = (*result[:16], wa_points, wa_exact, result[18], wa_error, *result[20:])
+
+    # Counted once per page rather than per row.
+    stats.rows_inserted += len(result_rows)
+    stats.wa_ok += len(scored) - wa_failed
+    stats.wa_failed += wa_failed
+    stats.wa_missing += len(result_rows) - len(scored)
+
+    where, params = replaces
+    results_db.replace_results(con=con, rows=result_rows, where=where, params=params)
 
 
 def sync_landsoversikt(
@@ -75,6 +545,7 @@ def sync_landsoversikt(
     sources: Iterable[Source] = SOURCES,
     refresh: bool = False,
     polite_delay_s: float = 0.5,
+    commit_every_pages: int = 32,
 ) -> SyncSummary:
     if not wa_db_path.exists():
         raise FileNotFoundError(f"Fant ikke WA scoring-db: {wa_db_path}")
@@ -86,247 +557,150 @@ def sync_landsoversikt(
         ensure_wa_poeng_importable(wa_poeng_root=wa_poeng_root)
         from wa_poeng import ScoreCalculator  # type: ignore
 
-        wa_events_by_gender = {src.gender: wa_event_names(wa_db_path=wa_db_path, gender=src.gender) for src in sources}
-
-        pages = 0
-        rows_seen = 0
-        rows_inserted = 0
-        wa_ok = 0
-        wa_failed = 0
-        wa_missing = 0
+        stats = _SyncStats()
+
+        years = list(years)
+        session = _PoliteSession(polite_delay_s)
+        # Landsstatistikk pages download in the background, in loop order, while earlier ones are ingested.
+        parse_pool = _parse_pool()
+
+        def load_landsstatistikk(job: tuple[str, int, str]) -> list[ScrapedResult]:
+            url, season, gender = job
+            html_bytes = fetch_landsstatistikk(url=url, cache_dir=cache_dir, refresh=refresh, session=session)
+            return parse_pool.submit(_parse_landsstatistikk_rows, html_bytes, season, gender, url).result()
+
+        landsstatistikk_pages = _prefetch(
+            load_landsstatistikk,
+            [
+                (build_landsstatistikk_url(showclass=src.showclass, season=year), year, src.gender)
+                for year in years
+                for src in sources
+                if not friidrett_pages_for_years(years=[int(year)], gender=src.gender)
+            ],
+        )
 
-        with ScoreCalculator(wa_db_path) as calc:
+        scoring_key = wa_scoring_key(wa_db_path=wa_db_path)
+        with (
+            results_db.bulk_ingest(con),
+            session,
+            parse_pool,
+            closing(landsstatistikk_pages),
+            _ScoringThread(ScoreCalculator, wa_db_path) as scorer,
+        ):
+            sink = _make_row_sink(con=con, scorer=scorer, wa_db_path=wa_db_path, scoring_key=scoring_key)
+            page_done = _make_page_committer(con=con, every=commit_every_pages)
             for year in years:
+                # Legacy pages are independent GETs; fetch them concurrently up front.
+                legacy_pages = [
+                    page for src in sources for page in friidrett_pages_for_years(years=[int(year)], gender=src.gender)
+                ]
+                # The polite session keeps one request per host in flight, spaced polite_delay_s apart.
+                prefetched = fetch_friidrett_pages(
+                    pages=legacy_pages, cache_dir=cache_dir, refresh=refresh, session=session
+                )
+
                 for src in sources:
                     pages_to_fetch = friidrett_pages_for_years(years=[int(year)], gender=src.gender)
                     if pages_to_fetch:
-                        wa_events = wa_events_by_gender.get(src.gender, set())
+                        # Parse every prefetched page of this gender in the worker processes up front.
+                        parse_jobs = {
+                            page.url: parse_pool.submit(
+                                parse_friidrett_page,
+                                html_bytes=body,
+                                season=int(year),
+                                gender=src.gender,
+                                source_url=page.url,
+                                parsed_cache_dir=cache_dir / "parsed",
+                            )
+                            for page in pages_to_fetch
+                            if isinstance(body := prefetched.get(page.url), bytes)
+                        }
                         for page in pages_to_fetch:
                             try:
-                                html_bytes = fetch_friidrett_page(url=page.url, cache_dir=cache_dir, refresh=refresh)
-                                parsed_rows = parse_friidrett_page(
-                                    html_bytes=html_bytes,
-                                    season=int(year),
-                                    gender=src.gender,
-                                    source_url=page.url,
-                                )
+                                # Popped so each page's rows are freed once it is ingested, not at the end of the gender.
+                                parse_job = parse_jobs.pop(page.url, None)
+                                if parse_job is not None:
+                                    parsed_rows = parse_job.result()
+                                else:
+                                    html_bytes = prefetched.get(page.url)
+                                    if html_bytes is None:
+                                        html_bytes = fetch_friidrett_page(
+                                            url=page.url, cache_dir=cache_dir, refresh=refresh, session=session
+                                        )
+                                    elif isinstance(html_bytes, Exception):
+                                        raise html_bytes
+                                    parsed_rows = parse_friidrett_page(
+                                        html_bytes=html_bytes,
+                                        season=int(year),
+                                        gender=src.gender,
+                                        source_url=page.url,
+                                        parsed_cache_dir=cache_dir / "parsed",
+                                    )
                             except Exception as exc:  # noqa: BLE001 - robust fallback for inconsistent legacy pages
                                 print(f"Advarsel: hoppet over legacy-side {page.url} ({src.gender} {year}): {type(exc).__name__}: {exc}")
                                 continue
                             if not parsed_rows:
                                 continue
-
-                            # Rebuild page deterministically: parser tweaks can change keys (e.g. dedup strategy).
-                            con.execute(
-                                "DELETE FROM results WHERE source_url = ? AND gender = ? AND season = ?",
-                                (page.url, src.gender, int(year)),
-                            )
-                            pages += 1
-
-                            for row in parsed_rows:
-                                rows_seen += 1
-
-                                wa_event = map_event_to_wa(event_no=row.event_no, gender=row.gender, wa_events=wa_events)
-                                meta = wa_event_meta(wa_db_path=wa_db_path, gender=row.gender, event=wa_event) if wa_event else None
-                                orientation = meta.orientation if meta else infer_orientation(row.event_no)
-
-                                results_db.upsert_athlete(
-                                    con=con,
-                                    athlete_id=row.athlete_id,
-                                    gender=row.gender,
-                                    name=row.athlete_name,
-                                    birth_date=row.birth_date,
-                                    nationality=row.nationality or "NOR",
-                                )
-                                club_id = results_db.get_or_create_club(con=con, club_name=row.club_name)
-                                event_id = results_db.get_or_create_event(
-                                    con=con,
-                                    gender=row.gender,
-                                    name_no=row.event_no,
-                                    wa_event=wa_event,
-                                    orientation=orientation,
-                                )
-
-                                perf_norm = normalize_performance(
-                                    performance=row.performance_clean or "",
-                                    orientation=orientation,
-                                    wa_event=wa_event,
-                                )
-                                value = performance_to_value(perf_norm)
-
-                                wa_points: Optional[int] = None
-                                wa_exact: Optional[int] = None
-                                wa_error: Optional[str] = None
-
-                                if wa_event and perf_norm:
-                                    try:
-                                        res = calc.points_for_performance(row.gender, wa_event, perf_norm)
-                                        wa_points = int(res["points"])
-                                        wa_exact = 1 if bool(res["exact"]) else 0
-                                        wa_ok += 1
-                                    except Exception as exc:  # noqa: BLE001 - loggable error detail
-                                        wa_failed += 1
-                                        wa_error = f"{type(exc).__name__}: {exc}"
-                                else:
-                                    wa_missing += 1
-
-                                results_db.upsert_result(
-                                    con=con,
-                                    season=row.season,
-                                    gender=row.gender,
-                                    event_id=event_id,
-                                    athlete_id=row.athlete_id,
-                                    club_id=club_id,
-                                    rank_in_list=row.rank_in_list,
-                                    performance_raw=_display_raw_performance(
-                                        performance_raw=row.performance_raw,
-                                        wa_event=wa_event,
-                                        performance_norm=perf_norm,
-                                    ),
-                                    performance_clean=perf_norm or None,
-                                    value=value,
-                                    wind=row.wind,
-                                    placement_raw=row.placement_raw,
-                                    competition_id=None,
-                                    competition_name=row.competition_name,
-                                    venue_city=row.venue_city,
-                                    stadium=None,
-                                    result_date=row.result_date,
-                                    wa_points=wa_points,
-                                    wa_exact=wa_exact,
-                                    wa_event=wa_event,
-                                    wa_error=wa_error,
-                                    source_url=row.source_url,
-                                    source_type="friidrett_legacy",
-                                )
-                                rows_inserted += 1
-
+                            # Registered before the skip check so unchanged pages still refresh last_synced_at.
                             results_db.upsert_source(
                                 con=con, source_type="friidrett_legacy", url=page.url,
                                 season=int(year), gender=src.gender, row_count=len(parsed_rows),
                             )
-                            con.commit()
-                            time.sleep(max(0.0, polite_delay_s))
-                        continue
+                            signature = _page_signature(parsed_rows=parsed_rows, scoring_key=scoring_key)
+                            if not refresh and signature == results_db.page_signature(
+                                con=con, source_url=page.url, gender=src.gender, season=int(year)
+                            ):
+                                stats.pages_skipped += 1
+                                continue
 
-                    url = build_landsstatistikk_url(showclass=src.showclass, season=year)
-                    html_bytes = fetch_landsstatistikk(url=url, cache_dir=cache_dir, refresh=refresh)
-                    pages += 1
+                            stats.pages += 1
 
-                    wa_events = wa_events_by_gender.get(src.gender, set())
-                    parsed_rows = list(parse_landsstatistikk(html_bytes=html_bytes, season=year, gender=src.gender, source_url=url))
-                    if not parsed_rows:
+                            # Rebuild page deterministically: parser tweaks can change keys (e.g. dedup strategy).
+                            _ingest_rows(
+                                sink=sink, stats=stats, rows=parsed_rows,
+                                events_gender=src.gender, source_type="friidrett_legacy",
+                                replaces=(_PAGE_RESULTS_WHERE, (page.url, src.gender, int(year))),
+                            )
+                            results_db.set_page_signature(
+                                con=con, source_url=page.url, gender=src.gender, season=int(year),
+                                signature=signature, row_count=len(parsed_rows),
+                            )
+                            page_done()
                         continue
 
-                    # Rebuild page deterministically: parser tweaks can change keys (e.g. performance normalisation).
-                    con.execute(
-                        "DELETE FROM results WHERE source_url = ? AND gender = ? AND season = ?",
-                        (url, src.gender, int(year)),
-                    )
-
-                    for row in parsed_rows:
-                        rows_seen += 1
-
-                        wa_event = map_event_to_wa(event_no=row.event_no, gender=row.gender, wa_events=wa_events)
-                        meta = wa_event_meta(wa_db_path=wa_db_path, gender=row.gender, event=wa_event) if wa_event else None
-                        orientation = meta.orientation if meta else infer_orientation(row.event_no)
-
-                        results_db.upsert_athlete(
-                            con=con,
-                            athlete_id=row.athlete_id,
-                            gender=row.gender,
-                            name=row.athlete_name,
-                            birth_date=row.birth_date,
-                            nationality=row.nationality or "NOR",
-                        )
-                        club_id = results_db.get_or_create_club(con=con, club_name=row.club_name)
-                        event_id = results_db.get_or_create_event(
-                            con=con,
-                            gender=row.gender,
-                            name_no=row.event_no,
-                            wa_event=wa_event,
-                            orientation=orientation,
-                        )
-                        competition_id = results_db.upsert_competition(
-                            con=con,
-                            competition_id=row.competition_id,
-                            name=row.competition_name,
-                            city=row.venue_city,
-                            stadium=row.stadium,
-                        )
-
-                        perf_norm = normalize_performance(
-                            performance=row.performance_clean or "",
-                            orientation=orientation,
-                            wa_event=wa_event,
-                        )
-                        value = performance_to_value(perf_norm)
-
-                        wa_points: Optional[int] = None
-                        wa_exact: Optional[int] = None
-                        wa_error: Optional[str] = None
-
-                        if wa_event and perf_norm:
-                            try:
-                                res = calc.points_for_performance(row.gender, wa_event, perf_norm)
-                                wa_points = int(res["points"])
-                                wa_exact = 1 if bool(res["exact"]) else 0
-                                wa_ok += 1
-                            except Exception as exc:  # noqa: BLE001 - loggable error detail
-                                wa_failed += 1
-                                wa_error = f"{type(exc).__name__}: {exc}"
-                        else:
-                            wa_missing += 1
-
-                        results_db.upsert_result(
-                            con=con,
-                            season=row.season,
-                            gender=row.gender,
-                            event_id=event_id,
-                            athlete_id=row.athlete_id,
-                            club_id=club_id,
-                            rank_in_list=row.rank_in_list,
-                            performance_raw=_display_raw_performance(
-                                performance_raw=row.performance_raw,
-                                wa_event=wa_event,
-                                performance_norm=perf_norm,
-                            ),
-                            performance_clean=perf_norm or None,
-                            value=value,
-                            wind=row.wind,
-                            placement_raw=row.placement_raw,
-                            competition_id=competition_id,
-                            competition_name=row.competition_name,
-                            venue_city=row.venue_city,
-                            stadium=row.stadium,
-                            result_date=row.result_date,
-                            wa_points=wa_points,
-                            wa_exact=wa_exact,
-                            wa_event=wa_event,
-                            wa_error=wa_error,
-                            source_url=row.source_url,
-                            source_type="minfriidrett",
-                        )
-                        rows_inserted += 1
-
+                    (url, _, _), loaded = next(landsstatistikk_pages)
+                    parsed_rows = loaded.result()
+                    if not parsed_rows:
+                        continue
                     results_db.upsert_source(
                         con=con, source_type="minfriidrett", url=url,
                         season=int(year), gender=src.gender, row_count=len(parsed_rows),
                     )
-                    con.commit()
-                    time.sleep(max(0.0, polite_delay_s))
+                    signature = _page_signature(parsed_rows=parsed_rows, scoring_key=scoring_key)
+                    if not refresh and signature == results_db.page_signature(
+                        con=con, source_url=url, gender=src.gender, season=int(year)
+                    ):
+                        stats.pages_skipped += 1
+                        continue
+
+                    stats.pages += 1
+
+                    # Rebuild page deterministically: parser tweaks can change keys (e.g. performance normalisation).
+                    _ingest_rows(
+                        sink=sink, stats=stats, rows=parsed_rows,
+                        events_gender=src.gender, source_type="minfriidrett", with_competitions=True,
+                        replaces=(_PAGE_RESULTS_WHERE, (url, src.gender, int(year))),
+                    )
+                    results_db.set_page_signature(
+                        con=con, source_url=url, gender=src.gender, season=int(year),
+                        signature=signature, row_count=len(parsed_rows),
+                    )
+                    page_done()
 
             results_db.fill_club_gaps(con)
             con.commit()
 
-        return SyncSummary(
-            pages=pages,
-            rows_seen=rows_seen,
-            rows_inserted=rows_inserted,
-            wa_points_ok=wa_ok,
-            wa_points_failed=wa_failed,
-            wa_points_missing=wa_missing,
-        )
+        return stats.summary()
     finally:
         con.close()
 
@@ -341,6 +715,7 @@ def sync_kondis(
     gender: str = "Both",
     refresh: bool = False,
     polite_delay_s: float = 0.5,
+    commit_every_pages: int = 32,
 ) -> SyncSummary:
     if not wa_db_path.exists():
         raise FileNotFoundError(f"Fant ikke WA scoring-db: {wa_db_path}")
@@ -356,135 +731,64 @@ def sync_kondis(
         ensure_wa_poeng_importable(wa_poeng_root=wa_poeng_root)
         from wa_poeng import ScoreCalculator  # type: ignore
 
-        genders = {p.gender for p in pages_to_fetch}
-        wa_events_by_gender = {g: wa_event_names(wa_db_path=wa_db_path, gender=g) for g in genders}
+        stats = _SyncStats()
 
-        pages = 0
-        rows_seen = 0
-        rows_inserted = 0
-        wa_ok = 0
-        wa_failed = 0
-        wa_missing = 0
+        session = _PoliteSession(polite_delay_s)
+        parse_pool = _parse_pool()
 
-        with ScoreCalculator(wa_db_path) as calc:
+        def load_page(page: KondisPage) -> list[KondisResult]:
+            html_bytes = fetch_kondis_stats(url=page.url, cache_dir=cache_dir, refresh=refresh, session=session)
+            return parse_pool.submit(_parse_kondis_rows, html_bytes, page, cache_dir / "parsed").result()
+
+        page_loads = _prefetch(load_page, [p for p in pages_to_fetch if getattr(p, "enabled", True)])
+
+        scoring_key = wa_scoring_key(wa_db_path=wa_db_path)
+        with results_db.bulk_ingest(con), session, parse_pool, closing(page_loads), _ScoringThread(ScoreCalculator, wa_db_path) as scorer:
+            sink = _make_row_sink(con=con, scorer=scorer, wa_db_path=wa_db_path, scoring_key=scoring_key)
+            page_done = _make_page_committer(con=con, every=commit_every_pages)
             for page in pages_to_fetch:
                 # Some historical pages are known-bad/missing. Keep them in the list so sync can purge any previously
                 # ingested rows, but skip fetching/ingesting.
                 if not getattr(page, "enabled", True):
                     con.execute("DELETE FROM results WHERE source_url = ?", (page.url,))
-                    con.commit()
+                    con.execute("DELETE FROM page_manifest WHERE source_url = ?", (page.url,))
+                    page_done()
                     continue
 
-                html_bytes = fetch_kondis_stats(url=page.url, cache_dir=cache_dir, refresh=refresh)
-                parsed_rows = list(parse_kondis_stats(html_bytes=html_bytes, page=page))
+                _, loaded = next(page_loads)
+                parsed_rows = loaded.result()
                 if not parsed_rows:
                     continue
-
-                # Rebuild page data deterministically: parser tweaks can change keys (e.g. ranks), so delete old rows.
-                con.execute("DELETE FROM results WHERE source_url = ?", (page.url,))
-                pages += 1
-
-                wa_events = wa_events_by_gender.get(page.gender, set())
-                for row in parsed_rows:
-                    rows_seen += 1
-
-                    wa_event = map_event_to_wa(event_no=row.event_no, gender=row.gender, wa_events=wa_events)
-                    meta = wa_event_meta(wa_db_path=wa_db_path, gender=row.gender, event=wa_event) if wa_event else None
-                    orientation = meta.orientation if meta else infer_orientation(row.event_no)
-
-                    results_db.upsert_athlete(
-                        con=con,
-                        athlete_id=row.athlete_id,
-                        gender=row.gender,
-                        name=row.athlete_name,
-                        birth_date=row.birth_date,
-                        nationality=row.nationality or "NOR",
-                    )
-                    club_id = results_db.get_or_create_club(con=con, club_name=row.club_name)
-                    event_id = results_db.get_or_create_event(
-                        con=con,
-                        gender=row.gender,
-                        name_no=row.event_no,
-                        wa_event=wa_event,
-                        orientation=orientation,
-                    )
-
-                    wa_event_hint = wa_event
-                    if wa_event_hint is None and row.event_no.lower().startswith("halvmaraton"):
-                        wa_event_hint = "HM"
-
-                    perf_norm = normalize_performance(
-                        performance=row.performance_clean or "",
-                        orientation=orientation,
-                        wa_event=wa_event_hint,
-                    )
-                    value = performance_to_value(perf_norm)
-
-                    wa_points: Optional[int] = None
-                    wa_exact: Optional[int] = None
-                    wa_error: Optional[str] = None
-
-                    if wa_event and perf_norm:
-                        try:
-                            res = calc.points_for_performance(row.gender, wa_event, perf_norm)
-                            wa_points = int(res["points"])
-                            wa_exact = 1 if bool(res["exact"]) else 0
-                            wa_ok += 1
-                        except Exception as exc:  # noqa: BLE001 - loggable error detail
-                            wa_failed += 1
-                            wa_error = f"{type(exc).__name__}: {exc}"
-                    else:
-                        wa_missing += 1
-
-                    results_db.upsert_result(
-                        con=con,
-                        season=row.season,
-                        gender=row.gender,
-                        event_id=event_id,
-                        athlete_id=row.athlete_id,
-                        club_id=club_id,
-                        rank_in_list=row.rank_in_list,
-                        performance_raw=_display_raw_performance(
-                            performance_raw=row.performance_raw,
-                            wa_event=wa_event,
-                            performance_norm=perf_norm,
-                        ),
-                        performance_clean=perf_norm or None,
-                        value=value,
-                        wind=row.wind,
-                        placement_raw=row.placement_raw,
-                        competition_id=None,
-                        competition_name=row.competition_name,
-                        venue_city=row.venue_city,
-                        stadium=None,
-                        result_date=row.result_date,
-                        wa_points=wa_points,
-                        wa_exact=wa_exact,
-                        wa_event=wa_event,
-                        wa_error=wa_error,
-                        source_url=row.source_url,
-                        source_type="kondis",
-                    )
-                    rows_inserted += 1
-
+                # Registered before the skip check so unchanged pages still refresh last_synced_at.
                 results_db.upsert_source(
                     con=con, source_type="kondis", url=page.url,
                     season=int(page.season), gender=page.gender, row_count=len(parsed_rows),
                 )
-                con.commit()
-                time.sleep(max(0.0, polite_delay_s))
+                signature = _page_signature(parsed_rows=parsed_rows, scoring_key=scoring_key)
+                if not refresh and signature == results_db.page_signature(
+                    con=con, source_url=page.url, gender=page.gender, season=int(page.season)
+                ):
+                    stats.pages_skipped += 1
+                    continue
+
+                stats.pages += 1
+
+                # Rebuild page data deterministically: parser tweaks can change keys (e.g. ranks), so old rows go.
+                _ingest_rows(
+                    sink=sink, stats=stats, rows=parsed_rows,
+                    events_gender=page.gender, source_type="kondis", kondis_event_hints=True,
+                    replaces=("source_url = ?", (page.url,)),
+                )
+                results_db.set_page_signature(
+                    con=con, source_url=page.url, gender=page.gender, season=int(page.season),
+                    signature=signature, row_count=len(parsed_rows),
+                )
+                page_done()
 
             results_db.fill_club_gaps(con)
             con.commit()
 
-        return SyncSummary(
-            pages=pages,
-            rows_seen=rows_seen,
-            rows_inserted=rows_inserted,
-            wa_points_ok=wa_ok,
-            wa_points_failed=wa_failed,
-            wa_points_missing=wa_missing,
-        )
+        return stats.summary()
     finally:
         con.close()
 
@@ -508,110 +812,28 @@ def sync_old_data(
         ensure_wa_poeng_importable(wa_poeng_root=wa_poeng_root)
         from wa_poeng import ScoreCalculator  # type: ignore
 
-        wa_events_by_gender = {
-            g: wa_event_names(wa_db_path=wa_db_path, gender=g)
-            for g in ("Men", "Women")
-        }
+        stats = _SyncStats()
 
-        pages = 0
-        rows_seen = 0
-        rows_inserted = 0
-        wa_ok = 0
-        wa_failed = 0
-        wa_missing = 0
-
-        with ScoreCalculator(wa_db_path) as calc:
+        scoring_key = wa_scoring_key(wa_db_path=wa_db_path)
+        with results_db.bulk_ingest(con), _ScoringThread(ScoreCalculator, wa_db_path) as scorer:
+            sink = _make_row_sink(con=con, scorer=scorer, wa_db_path=wa_db_path, scoring_key=scoring_key)
             for year in years:
                 parsed_rows = parse_old_data_dir(data_dir=data_dir, season=int(year))
                 if not parsed_rows:
                     continue
 
-                # Delete old rows from this source to allow idempotent re-import
+                stats.pages += 1
+
+                # Replace old rows from this source to allow idempotent re-import
                 # Handle both current format (old_data:...) and legacy format (file://old_data/...)
-                con.execute(
-                    "DELETE FROM results WHERE season = ? AND (source_url LIKE ? OR source_url LIKE ?)",
-                    (int(year), "old_data:%", f"file://old_data/{year}/%"),
+                _ingest_rows(
+                    sink=sink, stats=stats, rows=parsed_rows,
+                    events_gender=None, source_type="old_data",
+                    replaces=(
+                        "season = ? AND (source_url LIKE ? OR source_url LIKE ?)",
+                        (int(year), "old_data:%", f"file://old_data/{year}/%"),
+                    ),
                 )
-                pages += 1
-
-                for row in parsed_rows:
-                    rows_seen += 1
-
-                    wa_events = wa_events_by_gender.get(row.gender, set())
-                    wa_event = map_event_to_wa(event_no=row.event_no, gender=row.gender, wa_events=wa_events)
-                    meta = wa_event_meta(wa_db_path=wa_db_path, gender=row.gender, event=wa_event) if wa_event else None
-                    orientation = meta.orientation if meta else infer_orientation(row.event_no)
-
-                    results_db.upsert_athlete(
-                        con=con,
-                        athlete_id=row.athlete_id,
-                        gender=row.gender,
-                        name=row.athlete_name,
-                        birth_date=row.birth_date,
-                        nationality=row.nationality or "NOR",
-                    )
-                    club_id = results_db.get_or_create_club(con=con, club_name=row.club_name)
-                    event_id = results_db.get_or_create_event(
-                        con=con,
-                        gender=row.gender,
-                        name_no=row.event_no,
-                        wa_event=wa_event,
-                        orientation=orientation,
-                    )
-
-                    perf_norm = normalize_performance(
-                        performance=row.performance_clean or "",
-                        orientation=orientation,
-                        wa_event=wa_event,
-                    )
-                    value = performance_to_value(perf_norm)
-
-                    wa_points: Optional[int] = None
-                    wa_exact: Optional[int] = None
-                    wa_error: Optional[str] = None
-
-                    if wa_event and perf_norm:
-                        try:
-                            res = calc.points_for_performance(row.gender, wa_event, perf_norm)
-                            wa_points = int(res["points"])
-                            wa_exact = 1 if bool(res["exact"]) else 0
-                            wa_ok += 1
-                        except Exception as exc:  # noqa: BLE001 - loggable error detail
-                            wa_failed += 1
-                            wa_error = f"{type(exc).__name__}: {exc}"
-                    else:
-                        wa_missing += 1
-
-                    results_db.upsert_result(
-                        con=con,
-                        season=row.season,
-                        gender=row.gender,
-                        event_id=event_id,
-                        athlete_id=row.athlete_id,
-                        club_id=club_id,
-                        rank_in_list=row.rank_in_list,
-                        performance_raw=_display_raw_performance(
-                            performance_raw=row.performance_raw,
-                            wa_event=wa_event,
-                            performance_norm=perf_norm,
-                        ),
-                        performance_clean=perf_norm or None,
-                        value=value,
-                        wind=row.wind,
-                        placement_raw=row.placement_raw,
-                        competition_id=None,
-                        competition_name=row.competition_name,
-                        venue_city=row.venue_city,
-                        stadium=None,
-                        result_date=row.result_date,
-                        wa_points=wa_points,
-                        wa_exact=wa_exact,
-                        wa_event=wa_event,
-                        wa_error=wa_error,
-                        source_url=row.source_url,
-                        source_type="old_data",
-                    )
-                    rows_inserted += 1
 
                 # Register sources — old_data may have multiple source_urls per gender
                 source_counts: dict[tuple[str, str], int] = {}
@@ -628,13 +850,6 @@ def sync_old_data(
             results_db.fill_club_gaps(con)
             con.commit()
 
-        return SyncSummary(
-            pages=pages,
-            rows_seen=rows_seen,
-            rows_inserted=rows_inserted,
-            wa_points_ok=wa_ok,
-            wa_points_failed=wa_failed,
-            wa_points_missing=wa_missing,
-        )
+        return stats.summary()
     finally:
         con.close()
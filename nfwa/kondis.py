@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import hashlib
+import json
+import pickle
 import re
+import threading
+import time
+import zlib
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
 import requests
 from lxml import html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .util import clean_performance
+from .util import clean_performance, prepare_versioned_cache_dir, versioned_cache_dir
 
 _MANUAL_KONDIS_MARATON_MEN_2004_URL = "https://www.kondis.no/statistikk/norgesstatistikk-2004-maraton-menn/1529518"
 _REFERENCE_DATA_DIR = Path(__file__).resolve().parent / "reference_data"
@@ -58,7 +67,7 @@ class KondisPage:
     enabled: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KondisResult:
     season: int
     gender: str  # "Women" | "Men"
@@ -396,10 +405,43 @@ KONDIS_PAGES: tuple[KondisPage, ...] = (
 )
 
 
+@lru_cache(maxsize=1)
+def _page_positions_by_season_gender() -> dict[tuple[int, str], list[int]]:
+    # Positions in KONDIS_PAGES per (season, gender), so lookups don't scan the whole list.
+    out: dict[tuple[int, str], list[int]] = {}
+    for pos, page in enumerate(KONDIS_PAGES):
+        out.setdefault((page.season, page.gender), []).append(pos)
+    return out
+
+
 def pages_for_years(*, years: Iterable[int], gender: str) -> list[KondisPage]:
     ys = {int(y) for y in years}
-    genders = {"Women", "Men"} if gender == "Both" else {gender}
-    return [p for p in KONDIS_PAGES if p.season in ys and p.gender in genders]
+    genders = ("Women", "Men") if gender == "Both" else (gender,)
+    positions_by_key = _page_positions_by_season_gender()
+    positions = [
+        pos
+        for y in ys
+        for g in genders
+        for pos in positions_by_key.get((y, g), ())
+    ]
+    # Same order as KONDIS_PAGES: ingest order decides the ids new events/results get.
+    return [KONDIS_PAGES[pos] for pos in sorted(positions)]
+
+
+_HTTP_HEADERS = {"User-Agent": "nfwa-local/0.1 (contact: local)"}
+
+
+def _make_session() -> requests.Session:
+    sess = requests.Session()
+    sess.headers.update(_HTTP_HEADERS)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3))
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    return sess
+
+
+# Shared across calls so kondis.no pages reuse one keep-alive connection pool.
+_SESSION = _make_session()
 
 
 def fetch_kondis_stats(
@@ -409,20 +451,102 @@ def fetch_kondis_stats(
     refresh: bool = False,
     session: Optional[requests.Session] = None,
 ) -> bytes:
-    cache_dir.mkdir(parents=True, exist_ok=True)
     cache_path = cache_dir / _safe_cache_filename(url)
-    if cache_path.exists() and not refresh:
-        return cache_path.read_bytes()
-
-    sess = session or requests.Session()
-    headers = {"User-Agent": "nfwa-local/0.1 (contact: local)"}
+    missing_path = cache_path.with_name(cache_path.name + ".missing")
+    validators_path = cache_path.with_name(cache_path.name + ".headers")
+    cached = _read_cached_page(cache_path)
+    if not refresh:
+        if cached is not None:
+            return cached
+        _raise_if_known_missing(missing_path, url)
+
+    # A refresh of a cached page revalidates it: an unchanged page costs a 304 instead of the body.
+    headers = _HTTP_HEADERS
+    if cached is not None:
+        headers = {**_HTTP_HEADERS, **_revalidation_headers(validators_path)}
+
+    sess = session or _SESSION
     resp = sess.get(url, headers=headers, timeout=60)
+    if resp.status_code == 304 and cached is not None:
+        return cached
+    if resp.status_code in _MISSING_STATUSES:
+        # Remember dead pages for a while so later runs don't pay a round-trip to be told again.
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        missing_path.write_text(str(resp.status_code), encoding="utf-8")
     resp.raise_for_status()
     content = resp.content
-    cache_path.write_bytes(content)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_cached_page(cache_path, content)
+    _write_validators(validators_path, resp)
+    missing_path.unlink(missing_ok=True)
     return content
 
 
+def _revalidation_headers(validators_path: Path) -> dict[str, str]:
+    try:
+        validators = json.loads(validators_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    out: dict[str, str] = {}
+    if isinstance(validators, dict):
+        if validators.get("etag"):
+            out["If-None-Match"] = str(validators["etag"])
+        if validators.get("last_modified"):
+            out["If-Modified-Since"] = str(validators["last_modified"])
+    return out
+
+
+def _write_validators(validators_path: Path, resp: requests.Response) -> None:
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        validators_path.write_text(json.dumps({"etag": etag, "last_modified": last_modified}), encoding="utf-8")
+    else:
+        validators_path.unlink(missing_ok=True)
+
+
+_MISSING_STATUSES = frozenset({404, 410})
+_MISSING_TTL_S = 7 * 24 * 3600
+
+
+def _raise_if_known_missing(missing_path: Path, url: str) -> None:
+    try:
+        age_s = time.time() - missing_path.stat().st_mtime
+    except FileNotFoundError:
+        return
+    if age_s < _MISSING_TTL_S:
+        status = missing_path.read_text(encoding="utf-8").strip() or "404"
+        raise requests.HTTPError(f"{status} Client Error: siden manglet ved forrige forsøk (hurtigbufret) for url: {url}")
+
+
+def _read_cached_page(cache_path: Path) -> Optional[bytes]:
+    # Pages are cached gzip-compressed next to the old plain name (HTML shrinks ~5-8x). Plain
+    # files from older runs are still read and compressed the first time they are hit.
+    packed = _read_cached(cache_path.with_name(cache_path.name + ".gz"))
+    if packed is not None:
+        try:
+            return gzip.decompress(packed)
+        except (OSError, EOFError, zlib.error):
+            return None  # damaged cache entry: fetch again
+    plain = _read_cached(cache_path)
+    if plain is not None:
+        _write_cached_page(cache_path, plain)
+    return plain
+
+
+def _write_cached_page(cache_path: Path, content: bytes) -> None:
+    cache_path.with_name(cache_path.name + ".gz").write_bytes(gzip.compress(content, compresslevel=6, mtime=0))
+    cache_path.unlink(missing_ok=True)
+
+
+def _read_cached(cache_path: Path) -> Optional[bytes]:
+    # A cache hit is a single open; the directory is only created when a page is actually downloaded.
+    try:
+        return cache_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
 def _manual_rows_for_page(*, page: KondisPage) -> Optional[list[KondisResult]]:
     if page.gender == "Men" and page.event_no.lower().startswith("maraton"):
         csv_path = _MANUAL_KONDIS_MARATON_MEN_CSV_BY_SEASON.get(int(page.season))
@@ -464,11 +588,11 @@ def _load_manual_maraton_men_from_csv(*, page: KondisPage, csv_path: Path) -> li
                     wind=perf.wind,
                     athlete_id=int(athlete_id),
                     athlete_name=athlete_name,
-                    club_name=_none_if_empty((row.get("club_name") or "").strip()),
+                    club_name=_intern(_none_if_empty((row.get("club_name") or "").strip())),
                     birth_date=birth_date,
                     nationality=None,
                     placement_raw=None,
-                    venue_city=_none_if_empty((row.get("venue_city") or "").strip()),
+                    venue_city=_intern(_none_if_empty((row.get("venue_city") or "").strip())),
                     stadium=None,
                     competition_id=None,
                     competition_name=None,
@@ -480,12 +604,94 @@ def _load_manual_maraton_men_from_csv(*, page: KondisPage, csv_path: Path) -> li
     return out
 
 
-def parse_kondis_stats(*, html_bytes: bytes, page: KondisPage) -> Iterable[KondisResult]:
+# lxml parser objects are not safe to share between threads, so each thread keeps one.
+_PARSER_LOCAL = threading.local()
+
+
+def _html_parser() -> html.HTMLParser:
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = html.HTMLParser(collect_ids=False, remove_comments=True, remove_pis=True)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+# Parsed rows per (sha256 of body, page) for the last few bodies parsed without an on-disk
+# cache, so a body that is handed to parse_kondis_stats again skips the lxml/regex pass.
+# Kept small (least recently used first) so a long sync doesn't hold every page's rows.
+_PARSED_CACHE: dict[tuple[bytes, KondisPage], list[KondisResult]] = {}
+_PARSED_CACHE_SIZE = 8
+
+
+def _parser_version() -> bytes:
+    # On-disk parse results are only valid for the parser code that produced them.
+    h = hashlib.sha256()
+    for name in ("kondis.py", "util.py"):
+        h.update((Path(__file__).with_name(name)).read_bytes())
+    return h.digest()
+
+
+_PARSER_VERSION = _parser_version()
+
+
+def parse_kondis_stats(
+    *, html_bytes: bytes, page: KondisPage, parsed_cache_dir: Optional[Path] = None
+) -> Iterable[KondisResult]:
+    """Parse a Kondis statistics page (table, <pre> or plain-text layout).
+
+    With parsed_cache_dir set, rows are also pickled there keyed by body hash and parser
+    version, so warm runs skip parsing entirely.
+    """
     manual = _manual_rows_for_page(page=page)
     if manual is not None:
         return manual
 
-    doc = html.fromstring(html_bytes)
+    key = (hashlib.sha256(html_bytes).digest(), page)
+    if parsed_cache_dir is not None:
+        # The on-disk cache serves repeats, so the rows are not also held in memory.
+        rows = _load_parsed_rows(parsed_cache_dir, key)
+        if rows is None:
+            rows = _parse_kondis_stats_uncached(html_bytes=html_bytes, page=page)
+            _store_parsed_rows(parsed_cache_dir, key, rows)
+        return rows
+
+    cached = _PARSED_CACHE.pop(key, None)
+    if cached is None:
+        cached = _parse_kondis_stats_uncached(html_bytes=html_bytes, page=page)
+    _PARSED_CACHE[key] = cached
+    while len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+        del _PARSED_CACHE[next(iter(_PARSED_CACHE))]
+    return list(cached)
+
+
+def _parsed_cache_path(parsed_cache_dir: Path, key: tuple[bytes, KondisPage]) -> Path:
+    digest, page = key
+    h = hashlib.sha256(digest)
+    h.update(repr(page).encode("utf-8"))
+    version_dir = versioned_cache_dir(parsed_cache_dir, name="kondis", version=_PARSER_VERSION)
+    return version_dir / f"{page.season}_{page.gender.lower()}_{h.hexdigest()[:32]}.pkl"
+
+
+def _load_parsed_rows(parsed_cache_dir: Path, key: tuple[bytes, KondisPage]) -> Optional[list[KondisResult]]:
+    raw = _read_cached(_parsed_cache_path(parsed_cache_dir, key))
+    if raw is None:
+        return None
+    try:
+        rows = pickle.loads(raw)
+    except Exception:  # noqa: BLE001 - a broken cache entry just means re-parsing
+        return None
+    return rows if isinstance(rows, list) else None
+
+
+def _store_parsed_rows(parsed_cache_dir: Path, key: tuple[bytes, KondisPage], rows: list[KondisResult]) -> None:
+    path = _parsed_cache_path(parsed_cache_dir, key)
+    prepare_versioned_cache_dir(path.parent)
+    path.write_bytes(pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _parse_kondis_stats_uncached(*, html_bytes: bytes, page: KondisPage) -> list[KondisResult]:
+    # One lxml parse; the table, <pre> and plain-text passes all walk the same tree.
+    doc = html.fromstring(html_bytes, parser=_html_parser())
     out = _parse_kondis_stats_table(doc=doc, page=page)
     if out:
         return out
@@ -495,36 +701,46 @@ def parse_kondis_stats(*, html_bytes: bytes, page: KondisPage) -> Iterable[Kondi
     return _parse_kondis_stats_text(doc=doc, page=page)
 
 
-def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> list[KondisResult]:
-    tables = doc.xpath("//table")
-    if not tables:
-        return []
+_TABLE_HEADER_CELLS = frozenset({"navn", "name", "tid", "time"})
+_TABLE_HEADER_WORDS = ("oppnådd", "resultat", "beste", "pb", "tid")
 
-    table = _pick_best_table(tables)
-    if table is None:
+
+def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> list[KondisResult]:
+    rows = _best_table_rows(doc.getroottree().iter("table"))
+    if rows is None:
         return []
 
-    rows = table.xpath(".//tr")
     auto_rank = 0
     out: list[KondisResult] = []
 
-    for tr in rows:
-        cells = [c.text_content().strip() for c in tr.xpath("./th|./td")]
+    # Bound once; the loop below runs for every row of every table page.
+    looks_like_time = _looks_like_time
+    parse_rank_token = _parse_rank_token
+    parse_int = _parse_int
+    none_if_empty = _none_if_empty
+    match_rank_prefix = _RANK_PREFIX_RE.match
+    match_birth_year_cell = _BIRTH_YEAR_CELL_RE.match
+    match_time_token = _TIME_TOKEN_RE.match
+    build_result = _build_kondis_result
+    header_cells = _TABLE_HEADER_CELLS
+
+    for cells in rows:
         if not cells:
             continue
-        if all(not (c or "").strip() for c in cells):
+        if not any(cells):  # cells are already stripped
             continue
 
         # Skip obvious header-ish rows if they ever appear.
-        if any(c.lower() in {"navn", "name", "tid", "time"} for c in cells):
-            continue
-        header_blob = " ".join((c or "").lower() for c in cells)
-        if not (cells[0] or "").strip() and any(t in header_blob for t in ("oppnådd", "resultat", "beste", "pb", "tid")):
+        if any(c.lower() in header_cells for c in cells):
             continue
+        if not cells[0]:
+            header_blob = " ".join(cells).lower()
+            if any(t in header_blob for t in _TABLE_HEADER_WORDS):
+                continue
 
         auto_rank += 1
 
-        time_first = _looks_like_time(cells[0])
+        time_first = looks_like_time(cells[0])
         rank_in_list: int
 
         athlete_cell = ""
@@ -538,31 +754,31 @@ def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> lis
             # Legacy Kondis tables (esp. women 5 km ~2005-2009) use:
             # "1 Name" | "17.52" | "Race name"
             # Handle this shape explicitly so name/time don't get swapped.
-            m_rank_athlete = _RANK_PREFIX_RE.match(cells[0]) if cells else None
+            m_rank_athlete = match_rank_prefix(cells[0]) if cells else None
             if (
                 len(cells) >= 3
                 and m_rank_athlete
-                and not _looks_like_time(cells[1])
-                and _looks_like_time(cells[2])
+                and not looks_like_time(cells[1])
+                and looks_like_time(cells[2])
             ):
                 # Legacy maraton tables (e.g. men 2005) use:
                 # "1 Name, Club -YY" | "City" | "2.18.36 2.22.15 -04".
                 # Keep only first time token (season result), ignore PB suffix.
-                rank_in_list = _parse_rank_token(m_rank_athlete.group("rank")) or auto_rank
+                rank_in_list = parse_rank_token(m_rank_athlete.group("rank")) or auto_rank
                 athlete_cell = m_rank_athlete.group("rest").strip()
-                venue_city = _none_if_empty(cells[1])
+                venue_city = none_if_empty(cells[1])
                 raw_time = cells[2]
-                tm = _TIME_TOKEN_RE.match(raw_time)
+                tm = match_time_token(raw_time)
                 time_cell = tm.group("time") if tm else raw_time
                 if len(cells) > 3:
-                    date_cell = _none_if_empty(cells[3])
+                    date_cell = none_if_empty(cells[3])
             elif (
                 len(cells) >= 3
-                and _looks_like_time(cells[1])
-                and not _looks_like_time(cells[2])
+                and looks_like_time(cells[1])
+                and not looks_like_time(cells[2])
             ):
                 if m_rank_athlete:
-                    rank_in_list = _parse_rank_token(m_rank_athlete.group("rank")) or auto_rank
+                    rank_in_list = parse_rank_token(m_rank_athlete.group("rank")) or auto_rank
                     athlete_cell = m_rank_athlete.group("rest").strip()
                 else:
                     # Some legacy rows omit explicit rank and are shaped:
@@ -570,18 +786,18 @@ def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> lis
                     rank_in_list = auto_rank
                     athlete_cell = cells[0]
                 time_cell = cells[1]
-                competition_name = _none_if_empty(cells[2])
+                competition_name = none_if_empty(cells[2])
                 if len(cells) > 3:
-                    date_cell = _none_if_empty(cells[3])
+                    date_cell = none_if_empty(cells[3])
             else:
-                rank_in_list = _parse_rank_token(cells[0]) or auto_rank
+                rank_in_list = parse_rank_token(cells[0]) or auto_rank
 
                 # Scan for the actual time column — some wider legacy tables
                 # (e.g. 2003, 2005 half marathon) have club/birth/venue columns
                 # between the name and the result.
                 time_idx: Optional[int] = None
                 for idx in range(2, len(cells)):
-                    if _looks_like_time(cells[idx]):
+                    if looks_like_time(cells[idx]):
                         time_idx = idx
                         break
 
@@ -591,7 +807,7 @@ def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> lis
 
                     if len(pre_time) >= 2:
                         # Last cell before the time is typically venue/sted.
-                        venue_city = _none_if_empty(pre_time[-1])
+                        venue_city = none_if_empty(pre_time[-1])
                         athlete_parts = pre_time[:-1]
                     else:
                         athlete_parts = pre_time
@@ -603,7 +819,7 @@ def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> lis
                         p_s = p.strip()
                         if not p_s:
                             continue
-                        if re.match(r"^-\d{2,4}", p_s.replace("(*)", "").strip()):
+                        if "-" in p_s and match_birth_year_cell(p_s.replace("(*)", "").strip()):
                             if pieces:
                                 pieces[-1] += " " + p_s
                             else:
@@ -614,33 +830,33 @@ def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> lis
 
                     # Extract only the first time token (cell may contain PR info).
                     raw_time = cells[time_idx]
-                    tm = _TIME_TOKEN_RE.match(raw_time)
+                    tm = match_time_token(raw_time)
                     time_cell = tm.group("time") if tm else raw_time
                 else:
                     athlete_cell = cells[1] if len(cells) > 1 else ""
                     time_cell = cells[2] if len(cells) > 2 else ""
                     if len(cells) > 3:
-                        competition_name = _none_if_empty(cells[3])
+                        competition_name = none_if_empty(cells[3])
                     if len(cells) > 4:
-                        date_cell = _none_if_empty(cells[4])
+                        date_cell = none_if_empty(cells[4])
         else:
             rank_in_list = auto_rank
             time_cell = cells[0]
             athlete_cell = cells[1] if len(cells) > 1 else ""
             if len(cells) == 4:
-                venue_city = _none_if_empty(cells[2])
-                date_cell = _none_if_empty(cells[3])
+                venue_city = none_if_empty(cells[2])
+                date_cell = none_if_empty(cells[3])
             elif len(cells) >= 5:
-                if _parse_int(cells[2]) is not None:
-                    placement_raw = _none_if_empty(cells[2])
-                    venue_city = _none_if_empty(cells[3])
-                    date_cell = _none_if_empty(cells[4])
+                if parse_int(cells[2]) is not None:
+                    placement_raw = none_if_empty(cells[2])
+                    venue_city = none_if_empty(cells[3])
+                    date_cell = none_if_empty(cells[4])
                 else:
-                    competition_name = _none_if_empty(cells[2])
-                    venue_city = _none_if_empty(cells[3])
-                    date_cell = _none_if_empty(cells[4])
+                    competition_name = none_if_empty(cells[2])
+                    venue_city = none_if_empty(cells[3])
+                    date_cell = none_if_empty(cells[4])
 
-        row = _build_kondis_result(
+        row = build_result(
             page=page,
             rank_in_list=rank_in_list,
             athlete_cell=athlete_cell,
@@ -657,6 +873,9 @@ def _parse_kondis_stats_table(*, doc: html.HtmlElement, page: KondisPage) -> lis
 
 
 _TIME_TOKEN_RE = re.compile(r"(?P<time>\d+(?:(?:[:.,])\d{2}){1,3}(?:[A-Za-z]{1,3})?)")
+# _TIME_TOKEN_RE.match succeeds exactly when this prefix matches (everything after it is optional),
+# so yes/no time checks use the shorter pattern: no groups, no optional tails to try.
+_TIME_PREFIX_RE = re.compile(r"\d+[:.,]\d{2}")
 _DATE_TOKEN_RE = re.compile(
     r"(?P<day>\d{1,2})\s*[.,]\s*(?P<mon>[A-Za-z\u00c6\u00d8\u00c5\u00e6\u00f8\u00e5]{3,4})\b"
 )
@@ -671,6 +890,17 @@ _PRE_DENSE_ENTRY_RE = re.compile(
     r"(?P<time>\d+(?:(?:[:.,])\d{2}){1,3}(?:[A-Za-z]{1,3})?)"
     r"(?=\s*(?:\d{1,3}[.:)]\s*[A-Z\u00c6\u00d8\u00c5])|$)"
 )
+# Pre-compiled patterns for the per-row/per-line helpers below.
+_WHITESPACE_RE = re.compile(r"\s+")
+_FOOTNOTE_MARKER_RE = re.compile(r"\(\s*\*\s*\)")
+_VENUE_MARKER_RE = re.compile(r"^\(\s*[*&]\s*\)")
+_KONDIS_DATE_RE = re.compile(r"(?P<day>\d{1,2})\s*[.,]\s*(?P<mon>[A-Za-zÆØÅæøå]{3,4})\b")
+_BIRTH_YEAR_CELL_RE = re.compile(r"^-\d{2,4}")
+_BARE_RANK_RE = re.compile(r"\d{1,4}")
+_RANK_TOKEN_RE = re.compile(r"(?P<rank>\d{1,4})(?:[.,]\d|\.)")
+# A time or a PB year suffix run straight into the next rank number: "1.22.2911 Cornelia", "-0111 Nina".
+_PRE_TIME_THEN_RANK_RE = re.compile(r"(\d+(?:[.:,]\d{2}){2})(\d{1,4}\s+[A-Z\u00c6\u00d8\u00c5])")
+_PRE_PB_YEAR_THEN_RANK_RE = re.compile(r"(-\d{2})(\d{1,4}\s+[A-Z\u00c6\u00d8\u00c5])")
 _PRE_STOP_MARKERS = (
     "andre under",
     "utarbeidet av",
@@ -682,8 +912,8 @@ _PRE_STOP_MARKERS = (
 def _parse_kondis_stats_pre(*, doc: html.HtmlElement, page: KondisPage) -> list[KondisResult]:
     best: list[KondisResult] = []
 
-    for pre in doc.xpath("//pre"):
-        text = re.sub(r"\s+", " ", (pre.text_content() or "").replace("\u00a0", " ")).strip()
+    for pre in doc.getroottree().iter("pre"):
+        text = _WHITESPACE_RE.sub(" ", (pre.text_content() or "").replace("\u00a0", " ")).strip()
         if not text:
             continue
 
@@ -694,18 +924,10 @@ def _parse_kondis_stats_pre(*, doc: html.HtmlElement, page: KondisPage) -> list[
         # Some legacy pages run a time directly into the next rank number
         # (e.g. "1.22.2911 Cornelia" instead of "1.22.29 11 Cornelia").
         # Insert a space between the time ending and the rank beginning.
-        text = re.sub(
-            r"(\d+(?:[.:,]\d{2}){2})(\d{1,4}\s+[A-Z\u00c6\u00d8\u00c5])",
-            r"\1 \2",
-            text,
-        )
+        text = _PRE_TIME_THEN_RANK_RE.sub(r"\1 \2", text)
         # Similarly, PB year suffixes can merge with the next rank number
         # (e.g. "-0111 Nina" = PB year -01 + rank 11).
-        text = re.sub(
-            r"(-\d{2})(\d{1,4}\s+[A-Z\u00c6\u00d8\u00c5])",
-            r"\1 \2",
-            text,
-        )
+        text = _PRE_PB_YEAR_THEN_RANK_RE.sub(r"\1 \2", text)
 
         text = _truncate_pre_text(text)
         split_candidates = (
@@ -834,7 +1056,7 @@ def _parse_kondis_stats_text(*, doc: html.HtmlElement, page: KondisPage) -> list
     # Older Kondis pages (esp. ~2017-2019) can have results as plain text lines
     # instead of proper HTML tables.
     text = (doc.text_content() or "").replace("\u00a0", " ")
-    raw_lines = [re.sub(r"\s+", " ", ln).strip() for ln in text.splitlines()]
+    raw_lines = [_WHITESPACE_RE.sub(" ", ln).strip() for ln in text.splitlines()]
     lines = [ln for ln in raw_lines if ln]
 
     out: list[KondisResult] = []
@@ -844,7 +1066,7 @@ def _parse_kondis_stats_text(*, doc: html.HtmlElement, page: KondisPage) -> list
         line = lines[i]
 
         # Skip "page breaks" like "10", "20" in some lists.
-        if re.fullmatch(r"\d{1,4}", line):
+        if _BARE_RANK_RE.fullmatch(line):
             i += 1
             continue
 
@@ -852,7 +1074,7 @@ def _parse_kondis_stats_text(*, doc: html.HtmlElement, page: KondisPage) -> list
         if _starts_with_time_token(line) and _BIRTH_AT_END_RE.search(line) and not _DATE_TOKEN_RE.search(line):
             if i + 1 < len(lines):
                 nxt = lines[i + 1]
-                if nxt and not _starts_with_rank_or_time(nxt) and not re.fullmatch(r"\d{1,4}", nxt):
+                if nxt and not _starts_with_rank_or_time(nxt) and not _BARE_RANK_RE.fullmatch(nxt):
                     line = f"{line} {nxt}"
                     i += 1
 
@@ -980,22 +1202,47 @@ def _parse_kondis_text_line_spaces(*, line: str, page: KondisPage, auto_rank: in
     return (row, auto_rank)
 
 
-def _pick_best_table(tables: list[html.HtmlElement]) -> html.HtmlElement | None:
+def _table_rows(table: html.HtmlElement) -> list[list[str]]:
+    # Stripped th/td texts of every row, nested tables included; plain tree walks instead of
+    # building an XPath result list per row.
+    return [[_cell_text(c) for c in tr.iterchildren("th", "td")] for tr in table.iter("tr")]
+
+
+def _cell_text(cell: html.HtmlElement) -> str:
+    # Same text as cell.text_content().strip() without an XPath string() evaluation per cell;
+    # leaf cells (the common case, incl. empty spacer cells) are just their .text.
+    if len(cell) == 0:
+        return (cell.text or "").strip()
+    return "".join(cell.itertext()).strip()
+
+
+def _best_table_rows(tables: Iterable[html.HtmlElement]) -> list[list[str]] | None:
+    """Cell texts of the table with the most time-like rows; the winner's cells are reused by the caller."""
     best = None
     best_score = 0
     for t in tables:
-        score = 0
-        for tr in t.xpath(".//tr"):
-            cells = [c.text_content().strip() for c in tr.xpath("./th|./td")]
-            if any(_looks_like_time(c) for c in cells):
-                score += 1
+        # A table scores at most one point per row: skip the text extraction for tables that
+        # cannot beat the current best or reach the minimum (navigation, ads, layout scraps).
+        n_rows = sum(1 for _ in t.iter("tr"))
+        if n_rows <= best_score or n_rows < 3:
+            continue
+        rows = _table_rows(t)
+        score = sum(1 for cells in rows if any(_looks_like_time(c) for c in cells))
         if score > best_score:
             best_score = score
-            best = t
+            best = rows
     # Require at least a few time-like rows to avoid layout/navigation tables.
     return best if best_score >= 3 else None
 
 
+# Club/venue strings repeat across thousands of rows; share one object per value.
+_INTERNED: dict[str, str] = {}
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    return _INTERNED.setdefault(s, s) if s else s
+
+
 def _build_kondis_result(
     *,
     page: KondisPage,
@@ -1030,11 +1277,11 @@ def _build_kondis_result(
         wind=perf.wind,
         athlete_id=int(athlete_id),
         athlete_name=athlete_name,
-        club_name=club_name,
+        club_name=_intern(club_name),
         birth_date=birth_date,
         nationality=None,
         placement_raw=placement_raw,
-        venue_city=venue_city,
+        venue_city=_intern(venue_city),
         stadium=None,
         competition_id=None,
         competition_name=competition_name,
@@ -1075,19 +1322,19 @@ def _split_time_first_athlete_and_venue(text: str) -> tuple[str, str]:
 
     athlete_cell = s[: birth.end()].strip()
     venue = s[birth.end() :].strip()
-    venue = re.sub(r"^\(\s*[*&]\s*\)", "", venue).strip()
+    venue = _VENUE_MARKER_RE.sub("", venue).strip()
     venue = venue.lstrip("*").strip()
     venue = venue.lstrip(",-;/").strip()
     return (athlete_cell, venue)
 
 
 def _starts_with_time_token(text: str) -> bool:
-    return bool(_TIME_TOKEN_RE.match((text or "").strip()))
+    return _TIME_PREFIX_RE.match((text or "").strip()) is not None
 
 
 def _starts_with_rank_or_time(text: str) -> bool:
     t = (text or "").strip()
-    return bool(_TIME_TOKEN_RE.match(t) or _RANK_PREFIX_RE.match(t))
+    return bool(_TIME_PREFIX_RE.match(t) or _RANK_PREFIX_RE.match(t))
 
 
 def _none_if_empty(text: str) -> Optional[str]:
@@ -1096,10 +1343,12 @@ def _none_if_empty(text: str) -> Optional[str]:
 
 
 def _looks_like_time(text: str) -> bool:
-    t = (text or "").strip()
-    if not t:
+    s = (text or "").strip()
+    # Most cells are names/clubs/venues; reject those before the regex runs.
+    # isdigit() is a superset of \d, so the guard never drops a real match.
+    if not s[:1].isdigit() or not (":" in s or "." in s or "," in s):
         return False
-    return bool(_TIME_TOKEN_RE.match(t))
+    return _TIME_PREFIX_RE.match(s) is not None
 
 
 def _parse_int(text: str) -> Optional[int]:
@@ -1118,13 +1367,9 @@ def _parse_rank_token(text: str) -> Optional[int]:
     if rank_i is not None:
         return int(rank_i)
 
-    # Some Kondis tables use sub-ranking like "36.1", "36.2" (ties). Store the base rank.
-    m = re.fullmatch(r"(?P<rank>\d{1,4})[.,]\d", s)
-    if m:
-        return int(m.group("rank"))
-
-    # Also handle "36." style tokens if they appear.
-    m = re.fullmatch(r"(?P<rank>\d{1,4})\.", s)
+    # Some Kondis tables use sub-ranking like "36.1", "36.2" (ties), or "36." style tokens.
+    # Store the base rank.
+    m = _RANK_TOKEN_RE.fullmatch(s)
     if m:
         return int(m.group("rank"))
 
@@ -1140,7 +1385,7 @@ def _parse_kondis_date(text: str, *, season: int) -> Optional[str]:
     # - 11.okt
     # - 27,apr
     # - 24.Aug
-    m = re.search(r"(?P<day>\d{1,2})\s*[.,]\s*(?P<mon>[A-Za-zÆØÅæøå]{3,4})\b", t)
+    m = _KONDIS_DATE_RE.search(t)
     if not m:
         return None
     try:
@@ -1166,9 +1411,9 @@ def _parse_athlete_cell(text: str) -> tuple[str, Optional[str], Optional[int]]:
         return ("", None, None)
 
     # Remove footnote markers like "(*)"
-    s = re.sub(r"\(\s*\*\s*\)", "", s).strip()
+    s = _FOOTNOTE_MARKER_RE.sub("", s).strip()
     s = s.rstrip("*").strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _WHITESPACE_RE.sub(" ", s)
 
     birth_year: Optional[int] = None
     m = _BIRTH_YEAR_RE.search(s)
@@ -1206,9 +1451,16 @@ def _kondis_athlete_id(*, gender: str, name: str, birth_year: Optional[int]) ->
     return -1 - int(n)
 
 
+_URL_SCHEME_RE = re.compile(r"^https?://")
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+# Cache file names must stay stable across versions (existing caches are keyed by them), so the
+# sha1 digest stays; repeated URLs are memoised instead.
+@lru_cache(maxsize=1024)
 def _safe_cache_filename(url: str) -> str:
     digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
-    path = re.sub(r"^https?://", "", url)
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", path).strip("_").lower()
+    path = _URL_SCHEME_RE.sub("", url)
+    slug = _SLUG_RE.sub("_", path).strip("_").lower()
     slug = slug[:80] if slug else "kondis"
     return f"{slug}_{digest}.html"
@@ -17,7 +17,8 @@ _ATHLETE_ID_RE = re.compile(r"[?&]showathl=(?P<id>\d+)\b")
 _COMP_ID_RE = re.compile(r"posttoresultlist\((?P<id>\d+)\)")
 
 
-@dataclass(frozen=True)
+# slots: thousands of rows per season; no per-instance __dict__.
+@dataclass(frozen=True, slots=True)
 class ScrapedResult:
     season: int
     gender: str  # "Women" | "Men"
@@ -189,4 +189,5 @@ def _sum_sync_summaries(a: SyncSummary, b: SyncSummary) -> SyncSummary:
         wa_points_ok=int(a.wa_points_ok) + int(b.wa_points_ok),
         wa_points_failed=int(a.wa_points_failed) + int(b.wa_points_failed),
         wa_points_missing=int(a.wa_points_missing) + int(b.wa_points_missing),
+        pages_skipped=int(a.pages_skipped) + int(b.pages_skipped),
     )
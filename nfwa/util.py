@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+import shutil
 from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
 from typing import Optional
 
 
@@ -11,6 +13,24 @@ _HANDTIMED_RE = re.compile(r"(?P<perf>.+?)(?:\s*[hH])$")
 _PARENS_RE = re.compile(r"\([^)]*\)")
 _TRAILING_LETTERS_RE = re.compile(r"(?P<perf>.+?)(?:\s*[A-Za-z]{1,3})$")
 _JUMP_CM_RE = re.compile(r"^\d{3,4}$")
+_DIGIT_DASH_DIGIT_RE = re.compile(r"(?<=\d)[-–](?=\d)")
+_MULTI_COMMA_RE = re.compile(r",{2,}")
+_MULTI_DOT_RE = re.compile(r"\.{2,}")
+_WS_RE = re.compile(r"\s+")
+
+# Normalise odd time separators seen in some sources, e.g.:
+#   1´11,50 / 1'11,50 / 1′11,50  -> 1:11,50
+_TIME_SEPARATOR_TABLE = str.maketrans(
+    {
+        "\u00b4": ":",  # acute accent often used as minute marker
+        "\u2032": ":",  # prime
+        "\u2019": ":",  # right single quote
+        "\u2018": ":",  # left single quote
+        "\u02bc": ":",  # modifier letter apostrophe
+        "'": ":",
+        ";": ":",  # occasionally used as a mistaken time separator in legacy exports
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -95,25 +115,12 @@ def clean_performance(raw_value: str) -> Optional[CleanPerformance]:
     # Remove other annotations like "(ok)" etc.
     clean = _PARENS_RE.sub("", clean).strip()
 
-    # Normalise odd time separators seen in some sources, e.g.:
-    #   1´11,50 / 1'11,50 / 1′11,50  -> 1:11,50
-    clean = clean.translate(
-        str.maketrans(
-            {
-                "\u00b4": ":",  # acute accent often used as minute marker
-                "\u2032": ":",  # prime
-                "\u2019": ":",  # right single quote
-                "\u2018": ":",  # left single quote
-                "\u02bc": ":",  # modifier letter apostrophe
-                "'": ":",
-                ";": ":",  # occasionally used as a mistaken time separator in legacy exports
-            }
-        )
-    )
+    # Normalise odd time separators (see _TIME_SEPARATOR_TABLE).
+    clean = clean.translate(_TIME_SEPARATOR_TABLE)
 
     # Some sources (incl. some Kondis tables) use "-" / "–" between digits as a time separator, e.g. "3.33-07".
     # Normalise these to dots so time normalisation can handle them consistently.
-    clean = re.sub(r"(?<=\d)[-–](?=\d)", ".", clean)
+    clean = _DIGIT_DASH_DIGIT_RE.sub(".", clean)
 
     # Strip common suffixes like hand-timed "h"
     ht_match = _HANDTIMED_RE.match(clean)
@@ -135,11 +142,11 @@ def clean_performance(raw_value: str) -> Optional[CleanPerformance]:
             clean = clean[1:].strip()
 
     # Fix obvious separator glitches like "12,,07" and "12..07"
-    clean = re.sub(r",{2,}", ",", clean)
-    clean = re.sub(r"\.{2,}", ".", clean)
+    clean = _MULTI_COMMA_RE.sub(",", clean)
+    clean = _MULTI_DOT_RE.sub(".", clean)
 
     # Normalise whitespace
-    clean = re.sub(r"\s+", " ", clean)
+    clean = _WS_RE.sub(" ", clean)
     return CleanPerformance(raw=raw_display, clean=clean, wind=wind)
 
 
@@ -173,6 +180,11 @@ def normalize_performance(*, performance: str, orientation: str, wa_event: str |
     return text
 
 
+_TIME_PART_SPLIT_RE = re.compile(r"[.:]")
+_MIXED_DOT_COMMA_RE = re.compile(r"\s*(?P<a>\d+)\.(?P<b>\d{1,2}),(?P<c>\d{1,2})\s*")
+_MIXED_COMMA_DOT_RE = re.compile(r"\s*(?P<a>\d+),(?P<b>\d{1,2})\.(?P<c>\d{1,2})\s*")
+
+
 def _normalize_time_like(text: str, *, wa_event: str | None) -> str:
     text = text.strip()
     if not text:
@@ -181,7 +193,7 @@ def _normalize_time_like(text: str, *, wa_event: str | None) -> str:
     # Mixed separators (e.g. "3.41:02") appear on some Kondis pages.
     # Interpret these as h:mm:ss for long events, otherwise m:ss.cc.
     if "." in text and ":" in text and "," not in text:
-        parts = [p.strip() for p in re.split(r"[.:]", text) if p.strip()]
+        parts = [p.strip() for p in _TIME_PART_SPLIT_RE.split(text) if p.strip()]
         if parts and all(p.isdigit() for p in parts):
             nums = [int(p) for p in parts]
             hours_likely = _event_likely_has_hours(wa_event)
@@ -237,14 +249,14 @@ def _normalize_time_like(text: str, *, wa_event: str | None) -> str:
     # - m:ss.cc  (e.g. 2.22,28)
     # - h:mm:ss  (legacy typo on some long events, e.g. 3.12,43)
     if ":" not in text and "." in text and "," in text and text.count(",") == 1:
-        mixed = re.fullmatch(r"\s*(?P<a>\d+)\.(?P<b>\d{1,2}),(?P<c>\d{1,2})\s*", text)
+        mixed = _MIXED_DOT_COMMA_RE.fullmatch(text)
         if mixed:
             a = int(mixed.group("a"))
             b = int(mixed.group("b"))
             c = int(mixed.group("c"))
             if _event_likely_has_hours(wa_event) and a <= 9 and b <= 59 and c <= 59:
                 return f"{a}:{b:02d}:{c:02d}"
-        mixed_rev = re.fullmatch(r"\s*(?P<a>\d+),(?P<b>\d{1,2})\.(?P<c>\d{1,2})\s*", text)
+        mixed_rev = _MIXED_COMMA_DOT_RE.fullmatch(text)
         if mixed_rev:
             a = int(mixed_rev.group("a"))
             b = int(mixed_rev.group("b"))
@@ -310,8 +322,19 @@ def _normalize_jump_cm_mark(text: str, *, wa_event: str) -> Optional[str]:
     return f"{cm / 100:.2f}"
 
 
+_NUMBER_RE = re.compile(r"[0-9]+(?:[.,][0-9]+)?")
+
+
 def _looks_like_number(text: str) -> bool:
-    return bool(re.fullmatch(r"[0-9]+(?:[.,][0-9]+)?", text.strip()))
+    return bool(_NUMBER_RE.fullmatch(text.strip()))
+
+
+_EVENT_KM_RE = re.compile(r"^(?P<km>\d+)\s*km\b")
+_EVENT_KM_NOSPACE_RE = re.compile(r"^(?P<km>\d+)km\b")
+_EVENT_KM_WALK_RE = re.compile(r"^(?P<km>\d+)km\s+W$")
+_EVENT_M_WALK_THOUSANDS_RE = re.compile(r"^(?P<m>\d{1,3}(?:,\d{3})*)mW$")
+_EVENT_M_WALK_RE = re.compile(r"^(?P<m>\d[\d,]*)mW$")
+_EVENT_M_TRACK_RE = re.compile(r"^(?P<m>\d[\d,]*)m(?:\s+SC)?$")
 
 
 def _event_likely_has_hours(wa_event: str | None) -> bool:
@@ -323,15 +346,15 @@ def _event_likely_has_hours(wa_event: str | None) -> bool:
         return True
 
     # km-based (walk + road)
-    m = re.match(r"^(?P<km>\d+)\s*km\b", wa_event)
+    m = _EVENT_KM_RE.match(wa_event)
     if m:
         return int(m.group("km")) >= 10
-    m = re.match(r"^(?P<km>\d+)km\s+W$", wa_event)
+    m = _EVENT_KM_WALK_RE.match(wa_event)
     if m:
         return int(m.group("km")) >= 10
 
     # Meter-based walk with thousand separators, e.g. 10,000mW
-    m = re.match(r"^(?P<m>\d{1,3}(?:,\d{3})*)mW$", wa_event)
+    m = _EVENT_M_WALK_THOUSANDS_RE.match(wa_event)
     if m:
         meters = int(m.group("m").replace(",", ""))
         return meters >= 10000
@@ -344,20 +367,20 @@ def _event_likely_minsec_sep(wa_event: str) -> bool:
         return True
 
     # km-based (walk + road)
-    if re.match(r"^(?P<km>\d+)\s*km\b", wa_event) or re.match(r"^(?P<km>\d+)km\b", wa_event):
+    if _EVENT_KM_RE.match(wa_event) or _EVENT_KM_NOSPACE_RE.match(wa_event):
         return True
-    if re.match(r"^(?P<km>\d+)km\s+W$", wa_event):
+    if _EVENT_KM_WALK_RE.match(wa_event):
         return True
 
     # Walk meters (e.g. 3000mW, 10,000mW)
-    m = re.match(r"^(?P<m>\d[\d,]*)mW$", wa_event)
+    m = _EVENT_M_WALK_RE.match(wa_event)
     if m:
         return True
 
     # Track distances 600m+ and steeplechase are typically minute-based.
     if wa_event in {"Mile", "2 Miles"}:
         return True
-    m = re.match(r"^(?P<m>\d[\d,]*)m(?:\s+SC)?$", wa_event)
+    m = _EVENT_M_TRACK_RE.match(wa_event)
     if m:
         try:
             meters = int(m.group("m").replace(",", ""))
@@ -463,3 +486,30 @@ def format_performance_with_wind(
     if wind is None or not is_wind_event(wa_event):
         return perf
     return f"{perf}({format_wind(wind)})"
+
+
+def versioned_cache_dir(parent: Path, *, name: str, version: bytes) -> Path:
+    """Directory under parent for cache entries written by one code version: <name>-<version>."""
+    return parent / f"{name}-{version.hex()[:16]}"
+
+
+_PREPARED_CACHE_DIRS: set[Path] = set()
+
+
+def prepare_versioned_cache_dir(path: Path) -> None:
+    """Create a versioned_cache_dir before its first write in this process.
+
+    Sibling directories of the same name but another version are removed at the same time, so
+    caches keyed on a hash of the source code don't pile up with every edit. Loose .pkl files
+    directly in the parent date from before the versioned layout and are removed too.
+    """
+    if path in _PREPARED_CACHE_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    name = path.name.rsplit("-", 1)[0]
+    for other in path.parent.glob(f"{name}-*"):
+        if other != path and other.is_dir():
+            shutil.rmtree(other, ignore_errors=True)
+    for loose in path.parent.glob("*.pkl"):
+        loose.unlink(missing_ok=True)
+    _PREPARED_CACHE_DIRS.add(path)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import sqlite3
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -50,3 +52,24 @@ def wa_event_names(*, wa_db_path: Path, gender: str) -> set[str]:
     finally:
         con.close()
 
+
+@lru_cache(maxsize=32)
+def _wa_event_names_snapshot(wa_db_path: Path, gender: str, mtime_ns: int) -> frozenset[str]:
+    return frozenset(wa_event_names(wa_db_path=wa_db_path, gender=gender))
+
+
+def shared_wa_event_names(*, wa_db_path: Path, gender: str) -> frozenset[str]:
+    """wa_event_names, read once per process for each scoring DB and gender (again if the file changes).
+
+    A site build runs several syncs back to back against the same scoring DB.
+    """
+    return _wa_event_names_snapshot(wa_db_path, gender, wa_db_path.stat().st_mtime_ns)
+
+
+def wa_scoring_key(*, wa_db_path: Path) -> str:
+    """Content hash of the WA scoring DB; cached points are only valid for the tables they came from."""
+    digest = hashlib.sha1()
+    with wa_db_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()